@@ -0,0 +1,31 @@
+"""Index the machine columns used as list filters
+
+Tables are still created by metadata.create_all() at startup, which also
+builds these indexes on new databases; IF NOT EXISTS makes this revision a
+no-op there and adds them to databases created before the model change.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-16
+"""
+from alembic import op
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+# Names match what index=True on the Machine columns generates
+MACHINE_FILTER_INDEXES = {
+    "ix_machines_machine_type": "machine_type",
+    "ix_machines_status": "status",
+    "ix_machines_group_name": "group_name",
+}
+
+def upgrade():
+    for name, column in MACHINE_FILTER_INDEXES.items():
+        op.execute(f"CREATE INDEX IF NOT EXISTS {name} ON machines ({column})")
+
+def downgrade():
+    for name in MACHINE_FILTER_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
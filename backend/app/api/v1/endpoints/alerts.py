@@ -51,7 +51,7 @@ async def create_alert_rule(
         )
     
     db_rule = AlertRuleModel(
-        **rule.dict(),
+        **rule.model_dump(),
         created_by=current_user.get("sub", "admin")
     )
     
@@ -91,7 +91,7 @@ async def update_alert_rule(
             detail="Alert rule not found"
         )
     
-    update_data = rule_update.dict(exclude_unset=True)
+    update_data = rule_update.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(rule, field, value)
     
@@ -147,12 +147,12 @@ async def list_alerts(
     total = query.count()
     alerts = query.offset(skip).limit(limit).all()
     
-    return AlertsList(
-        alerts=alerts,
-        total=total,
-        page=skip // limit + 1,
-        size=limit
-    )
+    return {
+        "alerts": alerts,
+        "total": total,
+        "page": skip // limit + 1,
+        "size": limit
+    }
 
 @router.post("/", response_model=Alert)
 async def create_alert(
@@ -161,7 +161,7 @@ async def create_alert(
     current_user: dict = Depends(get_current_user)
 ):
     """Create new alert"""
-    db_alert = AlertModel(**alert.dict())
+    db_alert = AlertModel(**alert.model_dump())
     
     db.add(db_alert)
     db.commit()
@@ -199,7 +199,7 @@ async def update_alert(
             detail="Alert not found"
         )
     
-    update_data = alert_update.dict(exclude_unset=True)
+    update_data = alert_update.model_dump(exclude_unset=True)
     current_time = datetime.utcnow()
     current_username = current_user.get("sub", "admin")
     
@@ -259,7 +259,7 @@ async def get_alerts_summary(
         and_(AlertModel.severity == "low", AlertModel.status == AlertStatus.ACTIVE)
     ).count()
     
-    return AlertSummary(
+    return AlertSummary.model_construct(
         total_alerts=total_alerts,
         active_alerts=active_alerts,
         critical_alerts=critical_alerts,
@@ -48,7 +48,7 @@ async def update_configuration(
         db.add(config)
     
     # Update configuration fields
-    update_data = config_update.dict(exclude_unset=True)
+    update_data = config_update.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         if hasattr(config, field):
             setattr(config, field, value)
@@ -1,6 +1,6 @@
 # backend/app/api/v1/endpoints/machines.py
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, or_
 import uuid
@@ -50,12 +50,12 @@ async def list_machines(
     total = query.count()
     machines = query.offset(skip).limit(limit).all()
     
-    return MachineList(
-        machines=machines,
-        total=total,
-        page=skip // limit + 1,
-        size=limit
-    )
+    return {
+        "machines": machines,
+        "total": total,
+        "page": skip // limit + 1,
+        "size": limit
+    }
 
 @router.post("/", response_model=Machine)
 async def create_machine(
@@ -85,7 +85,7 @@ async def create_machine(
     db_machine = MachineModel(
         id=machine_id,
         api_key=api_key,
-        **machine.dict()
+        **machine.model_dump()
     )
     
     db.add(db_machine)
@@ -124,7 +124,7 @@ async def update_machine(
             detail="Machine not found"
         )
     
-    update_data = machine_update.dict(exclude_unset=True)
+    update_data = machine_update.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(machine, field, value)
     
@@ -160,15 +160,24 @@ async def delete_machine(
 @router.post("/register", response_model=Machine)
 async def register_machine(
     registration: MachineRegistration,
+    request: Request,
     db: Session = Depends(get_db)
 ):
     """Register a new machine from client agent"""
     machine_info = registration.machine_info
     hardware_info = registration.hardware_info
     
+    # ip_address is required; agents that do not report one are known by the address they connect from
+    ip_address = machine_info.get("ip_address") or (request.client.host if request.client else None)
+    if not ip_address:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="machine_info.ip_address is required"
+        )
+    
     # Check if machine already exists by IP
     existing = db.query(MachineModel).filter(
-        MachineModel.ip_address == machine_info.get("ip_address")
+        MachineModel.ip_address == ip_address
     ).first()
     
     if existing:
@@ -191,8 +200,8 @@ async def register_machine(
     
     db_machine = MachineModel(
         id=machine_id,
-        name=machine_info.get("hostname", f"Machine-{machine_info.get('ip_address')}"),
-        ip_address=machine_info.get("ip_address"),
+        name=machine_info.get("hostname", f"Machine-{ip_address}"),
+        ip_address=ip_address,
         hostname=machine_info.get("hostname"),
         os_name=machine_info.get("os_name"),
         os_version=machine_info.get("os_version"),
@@ -226,7 +235,7 @@ async def get_machine_stats(
     # Get latest metrics from hardware_info or return defaults
     hardware_info = machine.hardware_info or {}
     
-    return MachineStats(
+    return MachineStats.model_construct(
         machine_id=machine_id,
         cpu_usage=hardware_info.get("cpu_usage"),
         memory_usage=hardware_info.get("memory_usage"),
@@ -252,10 +261,11 @@ async def update_machine_status(
             detail="Machine not found"
         )
     
+    now = datetime.utcnow()
     machine.status = status
-    machine.updated_at = datetime.utcnow()
+    machine.updated_at = now
     if status == ConnectionStatus.ONLINE:
-        machine.last_seen = datetime.utcnow()
+        machine.last_seen = now
     
     db.commit()
     
@@ -11,6 +11,7 @@ import csv
 import io
 
 from app.core.database import get_db
+from app.core.cache import metrics_cache
 from app.core.security import get_current_user, get_current_agent
 from app.models.metrics import MetricData as MetricModel, MetricType
 from app.models.machine import Machine as MachineModel
@@ -51,12 +52,12 @@ async def list_metrics(
     total = query.count()
     metrics = query.offset(skip).limit(limit).all()
     
-    return MetricsList(
-        metrics=metrics,
-        total=total,
-        page=skip // limit + 1,
-        size=limit
-    )
+    return {
+        "metrics": metrics,
+        "total": total,
+        "page": skip // limit + 1,
+        "size": limit
+    }
 
 @router.post("/", response_model=List[MetricData])
 async def submit_metrics(
@@ -67,18 +68,23 @@ async def submit_metrics(
     """Submit metrics from client agent"""
     db_metrics = []
     
+    # Verify all referenced machines exist with one query per request, not per metric
+    machine_ids = {metric.machine_id for metric in metrics}
+    known_ids = {
+        row.id for row in db.query(MachineModel.id).filter(MachineModel.id.in_(machine_ids))
+    }
+    now = datetime.utcnow()
+    
     for metric in metrics:
-        # Verify machine belongs to the agent
-        machine = db.query(MachineModel).filter(MachineModel.id == metric.machine_id).first()
-        if not machine:
+        if metric.machine_id not in known_ids:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Machine {metric.machine_id} not found"
             )
         
         db_metric = MetricModel(
-            **metric.dict(),
-            timestamp=metric.timestamp or datetime.utcnow()
+            **metric.model_dump(),
+            timestamp=metric.timestamp or now
         )
         db.add(db_metric)
         db_metrics.append(db_metric)
@@ -89,6 +95,8 @@ async def submit_metrics(
     for metric in db_metrics:
         db.refresh(metric)
     
+    await metrics_cache.store_latest(db_metrics)
+    
     return db_metrics
 
 @router.post("/batch", response_model=List[MetricData])
@@ -113,7 +121,7 @@ async def submit_metrics_batch(
         db_metric = MetricModel(
             machine_id=batch.machine_id,
             timestamp=timestamp,
-            **metric.dict()
+            **metric.model_dump()
         )
         db.add(db_metric)
         db_metrics.append(db_metric)
@@ -128,6 +136,8 @@ async def submit_metrics_batch(
     for metric in db_metrics:
         db.refresh(metric)
     
+    await metrics_cache.store_latest(db_metrics)
+    
     return db_metrics
 
 @router.get("/realtime")
@@ -143,12 +153,16 @@ async def get_realtime_metrics(
         query = query.filter(MachineModel.id.in_(machine_ids))
     
     machines = query.all()
+    cached = await metrics_cache.get_latest([str(machine.id) for machine in machines])
     realtime_data = {}
     
     for machine in machines:
-        # Get latest metrics for each type
-        latest_metrics = {}
+        # Get latest metrics for each type, from the shared cache when present and the database otherwise
+        latest_metrics = cached.get(str(machine.id), {})
         for metric_type in MetricType:
+            if metric_type.value in latest_metrics:
+                continue
+            
             latest = db.query(MetricModel).filter(
                 and_(
                     MetricModel.machine_id == machine.id,
@@ -175,7 +189,7 @@ async def get_realtime_metrics(
 
 @router.get("/export")
 async def export_metrics(
-    format: str = Query(..., regex="^(json|csv|xlsx)$"),
+    format: str = Query(..., pattern="^(json|csv|xlsx)$"),
     machine_ids: Optional[List[uuid.UUID]] = Query(None),
     metric_types: Optional[List[MetricType]] = Query(None),
     start_time: Optional[datetime] = None,
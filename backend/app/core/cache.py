@@ -0,0 +1,140 @@
+# backend/app/core/cache.py
+import json
+import logging
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List
+
+from app.core.config import settings
+
+try:
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+LATEST_METRICS_KEY = "metrics:latest:{machine_id}"
+
+# Sets each field only if its "ts" is not older than the cached one, then renews the key's TTL.
+# ARGV: ttl, then (field, ts, payload) triples.
+STORE_LATEST_SCRIPT = """
+local key = KEYS[1]
+for i = 2, #ARGV, 3 do
+    local current = redis.call('HGET', key, ARGV[i])
+    if not current or (tonumber(cjson.decode(current)['ts']) or 0) <= tonumber(ARGV[i + 1]) then
+        redis.call('HSET', key, ARGV[i], ARGV[i + 2])
+    end
+end
+redis.call('EXPIRE', key, ARGV[1])
+"""
+
+def _epoch(timestamp: datetime) -> float:
+    """Seconds since the epoch; naive timestamps are UTC, as the models store them"""
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return timestamp.timestamp()
+
+class MetricsCache:
+    """Latest metric values per machine, shared across workers through Redis.
+
+    Every method degrades to a no-op when Redis is not installed or not
+    reachable, so callers fall back to querying the database.
+    """
+
+    def __init__(self, url: str, connect_timeout: float, ttl: int):
+        self.url = url
+        self.connect_timeout = connect_timeout
+        self.ttl = ttl
+        self.client = None
+
+    @property
+    def is_connected(self) -> bool:
+        return self.client is not None
+
+    async def connect(self):
+        """Connect to Redis if the client library is installed"""
+        if not REDIS_AVAILABLE:
+            logger.info("redis package not installed, latest-metrics cache disabled")
+            return
+
+        client = aioredis.from_url(
+            self.url,
+            decode_responses=True,
+            socket_connect_timeout=self.connect_timeout
+        )
+        try:
+            await client.ping()
+        except Exception as e:
+            logger.warning(f"Redis unavailable at {self.url}, latest-metrics cache disabled: {e}")
+            await client.close()
+            return
+
+        self.client = client
+
+    async def disconnect(self):
+        if self.client is not None:
+            await self.client.close()
+            self.client = None
+
+    async def store_latest(self, metrics: Iterable[Any]):
+        """Record metric rows as the latest value of their type for each machine
+
+        A row older than the cached value of its type is ignored, so late or
+        backfilled samples cannot replace newer ones.
+        """
+        if self.client is None:
+            return
+
+        by_machine: Dict[str, Dict[str, Any]] = defaultdict(dict)
+        for metric in metrics:
+            ts = _epoch(metric.timestamp)
+            fields = by_machine[str(metric.machine_id)]
+            current = fields.get(metric.metric_type.value)
+            if current is None or current[0] <= ts:
+                fields[metric.metric_type.value] = (ts, metric)
+
+        if not by_machine:
+            return
+
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                for machine_id, fields in by_machine.items():
+                    args = [self.ttl]
+                    for metric_type, (ts, metric) in fields.items():
+                        args.extend((metric_type, ts, json.dumps({
+                            "value": metric.value,
+                            "unit": metric.unit,
+                            "timestamp": metric.timestamp.isoformat(),
+                            "component_name": metric.component_name,
+                            "ts": ts
+                        })))
+                    pipe.eval(STORE_LATEST_SCRIPT, 1, LATEST_METRICS_KEY.format(machine_id=machine_id), *args)
+                await pipe.execute()
+        except Exception as e:
+            logger.error(f"Error caching latest metrics: {e}")
+
+    async def get_latest(self, machine_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get cached latest metrics keyed by machine id; machines without an entry are omitted"""
+        if self.client is None or not machine_ids:
+            return {}
+
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                for machine_id in machine_ids:
+                    pipe.hgetall(LATEST_METRICS_KEY.format(machine_id=machine_id))
+                results = await pipe.execute()
+        except Exception as e:
+            logger.error(f"Error reading latest metrics cache: {e}")
+            return {}
+
+        latest = {}
+        for machine_id, fields in zip(machine_ids, results):
+            if fields:
+                latest[machine_id] = {metric_type: json.loads(raw) for metric_type, raw in fields.items()}
+                for entry in latest[machine_id].values():
+                    entry.pop("ts", None)
+        return latest
+
+metrics_cache = MetricsCache(settings.REDIS_URL, settings.REDIS_CONNECT_TIMEOUT, settings.METRICS_CACHE_TTL)
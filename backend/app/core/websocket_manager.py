@@ -1,13 +1,19 @@
 # backend/app/core/websocket_manager.py
-import json
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set
 from fastapi import WebSocket, WebSocketDisconnect
 import asyncio
 from datetime import datetime
+import orjson
+
+from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+def encode_message(message: Dict[str, Any]) -> str:
+    """Serialize a message once so it can be sent to any number of clients"""
+    return orjson.dumps(message).decode()
+
 class WebSocketManager:
     def __init__(self):
         # Store active connections by client_id
@@ -18,13 +24,16 @@ class WebSocketManager:
         self.last_seen: Dict[str, datetime] = {}
         # Message queue for broadcasting
         self.message_queue: asyncio.Queue = asyncio.Queue()
+        # Fire-and-forget tasks; the loop only keeps weak references, so hold them until done
+        self._background_tasks: Set[asyncio.Task] = set()
         
     async def connect(self, websocket: WebSocket, client_type: str, client_id: str):
         """Accept new WebSocket connection"""
         await websocket.accept()
         self.active_connections[client_id] = websocket
         self.client_types[client_id] = client_type
-        self.last_seen[client_id] = datetime.utcnow()
+        now = datetime.utcnow()
+        self.last_seen[client_id] = now
         
         logger.info(f"Client {client_id} ({client_type}) connected. Total connections: {len(self.active_connections)}")
         
@@ -32,7 +41,7 @@ class WebSocketManager:
         await self.send_personal_message({
             "type": "connection_established",
             "client_id": client_id,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": now.isoformat()
         }, websocket)
         
         # Notify other dashboard clients about new connection
@@ -40,7 +49,7 @@ class WebSocketManager:
             await self.broadcast_to_dashboards({
                 "type": "agent_connected",
                 "client_id": client_id,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": now.isoformat()
             })
     
     def disconnect(self, websocket: WebSocket, client_id: str):
@@ -55,7 +64,7 @@ class WebSocketManager:
             
             # Notify dashboard clients about disconnection
             if client_type == "agent":
-                asyncio.create_task(self.broadcast_to_dashboards({
+                self._spawn(self.broadcast_to_dashboards({
                     "type": "agent_disconnected",
                     "client_id": client_id,
                     "timestamp": datetime.utcnow().isoformat()
@@ -64,46 +73,68 @@ class WebSocketManager:
     async def send_personal_message(self, message: Dict[str, Any], websocket: WebSocket):
         """Send message to specific WebSocket connection"""
         try:
-            await websocket.send_text(json.dumps(message))
+            await websocket.send_text(encode_message(message))
         except Exception as e:
             logger.error(f"Error sending personal message: {e}")
     
     async def broadcast_message(self, message: Dict[str, Any]):
         """Broadcast message to all connected clients"""
-        disconnected_clients = []
-        for client_id, websocket in self.active_connections.items():
-            try:
-                await websocket.send_text(json.dumps(message))
-            except Exception as e:
-                logger.error(f"Error broadcasting to {client_id}: {e}")
-                disconnected_clients.append(client_id)
-        
-        # Clean up disconnected clients
-        for client_id in disconnected_clients:
-            if client_id in self.active_connections:
-                self.disconnect(self.active_connections[client_id], client_id)
+        await self._broadcast(encode_message(message), list(self.active_connections))
     
     async def broadcast_to_dashboards(self, message: Dict[str, Any]):
         """Broadcast message only to dashboard clients"""
-        disconnected_clients = []
-        for client_id, websocket in self.active_connections.items():
-            if self.client_types.get(client_id) == "dashboard":
-                try:
-                    await websocket.send_text(json.dumps(message))
-                except Exception as e:
-                    logger.error(f"Error broadcasting to dashboard {client_id}: {e}")
-                    disconnected_clients.append(client_id)
+        client_ids = [
+            client_id for client_id, client_type in self.client_types.items()
+            if client_type == "dashboard"
+        ]
+        await self._broadcast(encode_message(message), client_ids)
+    
+    async def _broadcast(self, payload: str, client_ids: List[str]):
+        """Send payload to all given clients concurrently, dropping any that fail or stall"""
+        targets = [
+            (client_id, self.active_connections[client_id])
+            for client_id in client_ids
+            if client_id in self.active_connections
+        ]
+        if not targets:
+            return
         
-        # Clean up disconnected clients
-        for client_id in disconnected_clients:
-            if client_id in self.active_connections:
-                self.disconnect(self.active_connections[client_id], client_id)
+        results = await asyncio.gather(
+            *(
+                asyncio.wait_for(websocket.send_text(payload), timeout=settings.WS_SEND_TIMEOUT)
+                for _, websocket in targets
+            ),
+            return_exceptions=True
+        )
+        
+        # Clean up disconnected or stalled clients
+        for (client_id, websocket), result in zip(targets, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error broadcasting to {client_id}: {result!r}")
+                if self.active_connections.get(client_id) is websocket:
+                    self.disconnect(websocket, client_id)
+                    # Close the socket too, so the client notices and reconnects instead of going silent
+                    self._spawn(self._close_quietly(websocket))
+    
+    def _spawn(self, coro) -> asyncio.Task:
+        """Run a coroutine in the background, keeping a reference until it finishes"""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+    
+    async def _close_quietly(self, websocket: WebSocket):
+        """Close a dropped client's socket, ignoring errors from connections that are already gone"""
+        try:
+            await asyncio.wait_for(websocket.close(code=1011), timeout=settings.WS_SEND_TIMEOUT)
+        except Exception:
+            pass
     
     async def send_to_client(self, client_id: str, message: Dict[str, Any]):
         """Send message to specific client"""
         if client_id in self.active_connections:
             try:
-                await self.active_connections[client_id].send_text(json.dumps(message))
+                await self.active_connections[client_id].send_text(encode_message(message))
             except Exception as e:
                 logger.error(f"Error sending to {client_id}: {e}")
                 self.disconnect(self.active_connections[client_id], client_id)
@@ -111,11 +142,13 @@ class WebSocketManager:
     async def handle_message(self, websocket: WebSocket, client_type: str, client_id: str, data: Dict[str, Any]):
         """Handle incoming WebSocket message"""
         try:
-            self.last_seen[client_id] = datetime.utcnow()
+            now = datetime.utcnow()
+            if client_id in self.active_connections:
+                self.last_seen[client_id] = now
             message_type = data.get("type")
             
             if message_type == "ping":
-                await self.send_personal_message({"type": "pong", "timestamp": datetime.utcnow().isoformat()}, websocket)
+                await self.send_personal_message({"type": "pong", "timestamp": now.isoformat()}, websocket)
             
             elif message_type == "metrics_update" and client_type == "agent":
                 # Forward metrics to dashboard clients
@@ -123,7 +156,7 @@ class WebSocketManager:
                     "type": "metrics_update",
                     "client_id": client_id,
                     "data": data.get("data", {}),
-                    "timestamp": datetime.utcnow().isoformat()
+                    "timestamp": now.isoformat()
                 })
             
             elif message_type == "machine_registration" and client_type == "agent":
@@ -132,7 +165,7 @@ class WebSocketManager:
                     "type": "machine_registered",
                     "client_id": client_id,
                     "machine_info": data.get("machine_info", {}),
-                    "timestamp": datetime.utcnow().isoformat()
+                    "timestamp": now.isoformat()
                 })
             
             else:
@@ -4,11 +4,15 @@ import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
+import orjson
 import uvicorn
 
 from app.core.config import settings
 from app.core.database import database, engine, metadata
+from app.core.cache import metrics_cache
 from app.core.websocket_manager import WebSocketManager
 from app.api.v1.api import api_router
 from app.services.hardware_simulator import HardwareSimulator
@@ -35,6 +39,9 @@ async def lifespan(app: FastAPI):
     metadata.create_all(engine)
     logger.info("Database connected and tables created")
     
+    # Connect shared latest-metrics cache (optional)
+    await metrics_cache.connect()
+    
     # Start hardware simulator for autonomous operation
     await hardware_simulator.start()
     logger.info("Hardware simulator started")
@@ -54,14 +61,19 @@ async def lifespan(app: FastAPI):
     await hardware_simulator.stop()
     await metrics_processor.stop()
     await alert_manager.stop()
+    await metrics_cache.disconnect()
     await database.disconnect()
 
-# Create FastAPI app
+# Create FastAPI app (schema and interactive docs are not exposed in production)
+is_production = settings.ENVIRONMENT == "production"
 app = FastAPI(
     title=settings.PROJECT_NAME,
     description="Revolutionary 3D Infrastructure Monitoring Dashboard",
     version="3.0.0",
-    openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    openapi_url=None if is_production else f"{settings.API_V1_STR}/openapi.json",
+    docs_url=None if is_production else "/docs",
+    redoc_url=None if is_production else "/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -74,6 +86,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger JSON responses (machine lists, metrics history, exports)
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=4)
+
 # Include API routes
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
@@ -94,7 +109,7 @@ async def websocket_endpoint(websocket: WebSocket, client_type: str, client_id:
     await websocket_manager.connect(websocket, client_type, client_id)
     try:
         while True:
-            data = await websocket.receive_json()
+            data = orjson.loads(await websocket.receive_text())
             await websocket_manager.handle_message(websocket, client_type, client_id, data)
     except WebSocketDisconnect:
         websocket_manager.disconnect(websocket, client_id)
@@ -113,6 +128,8 @@ if __name__ == "__main__":
         "main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
-        log_level="info"
+        reload=not is_production,
+        ws_per_message_deflate=settings.WS_PER_MESSAGE_DEFLATE,
+        log_level="warning" if is_production else "info",
+        access_log=not is_production
     )
\ No newline at end of file
@@ -28,8 +28,8 @@ class Machine(Base):
     name = sa.Column(sa.String(255), nullable=False, index=True)
     ip_address = sa.Column(sa.String(45), nullable=False, index=True)  # IPv4 or IPv6
     port = sa.Column(sa.Integer, default=8001)
-    machine_type = sa.Column(sa.Enum(MachineType), default=MachineType.SERVER)
-    status = sa.Column(sa.Enum(ConnectionStatus), default=ConnectionStatus.UNKNOWN)
+    machine_type = sa.Column(sa.Enum(MachineType), default=MachineType.SERVER, index=True)
+    status = sa.Column(sa.Enum(ConnectionStatus), default=ConnectionStatus.UNKNOWN, index=True)
     
     # Machine information
     hostname = sa.Column(sa.String(255))
@@ -61,7 +61,7 @@ class Machine(Base):
     
     # Tags and groups
     tags = sa.Column(JSONB, default=[])
-    group_name = sa.Column(sa.String(100), default="default")
+    group_name = sa.Column(sa.String(100), default="default", index=True)
     
     # 3D visualization data
     position_3d = sa.Column(JSONB, default={"x": 0, "y": 0, "z": 0})
@@ -1,6 +1,6 @@
 # backend/app/schemas/alerts.py
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 import uuid
 
@@ -43,8 +43,7 @@ class AlertRule(AlertRuleBase):
     updated_at: datetime
     created_by: str
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 class AlertBase(BaseModel):
     title: str = Field(..., min_length=1, max_length=255)
@@ -79,8 +78,7 @@ class Alert(AlertBase):
     resolved_by: Optional[str] = None
     notes: Optional[str] = None
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 class AlertsList(BaseModel):
     alerts: List[Alert]
@@ -1,6 +1,6 @@
 # backend/app/schemas/configuration.py
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 import uuid
 
@@ -38,7 +38,7 @@ class AlertConfig(BaseModel):
     webhook_headers: Dict[str, str] = Field(default_factory=dict)
 
 class UIConfig(BaseModel):
-    theme: str = Field(default="cyberpunk", regex="^(cyberpunk|corporate|minimal)$")
+    theme: str = Field(default="cyberpunk", pattern="^(cyberpunk|corporate|minimal)$")
     refresh_interval: int = Field(default=5, ge=1, le=60)
     max_machines_display: int = Field(default=50, ge=10, le=1000)
     enable_3d: bool = True
@@ -84,11 +84,10 @@ class SystemConfiguration(SystemConfigurationBase):
     backup_enabled: bool
     last_backup_at: Optional[datetime] = None
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 class ConfigurationTest(BaseModel):
-    service: str = Field(..., regex="^(influxdb|mqtt|email|slack|webhook)$")
+    service: str = Field(..., pattern="^(influxdb|mqtt|email|slack|webhook)$")
     config: Dict[str, Any]
 
 class ConfigurationTestResult(BaseModel):
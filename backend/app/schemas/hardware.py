@@ -1,6 +1,6 @@
 # backend/app/schemas/hardware.py
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 import uuid
 
@@ -21,7 +21,7 @@ class HardwareComponentBase(BaseModel):
     position_3d: Dict[str, float] = Field(default_factory=lambda: {"x": 0, "y": 0, "z": 0})
     rotation_3d: Dict[str, float] = Field(default_factory=lambda: {"x": 0, "y": 0, "z": 0})
     scale_3d: Dict[str, float] = Field(default_factory=lambda: {"x": 1, "y": 1, "z": 1})
-    color_override: Optional[str] = Field(None, regex="^#[0-9a-fA-F]{6}$")
+    color_override: Optional[str] = Field(None, pattern="^#[0-9a-fA-F]{6}$")
 
 class HardwareComponentCreate(HardwareComponentBase):
     machine_id: uuid.UUID
@@ -39,7 +39,7 @@ class HardwareComponentUpdate(BaseModel):
     position_3d: Optional[Dict[str, float]] = None
     rotation_3d: Optional[Dict[str, float]] = None
     scale_3d: Optional[Dict[str, float]] = None
-    color_override: Optional[str] = Field(None, regex="^#[0-9a-fA-F]{6}$")
+    color_override: Optional[str] = Field(None, pattern="^#[0-9a-fA-F]{6}$")
 
 class HardwareComponent(HardwareComponentBase):
     id: uuid.UUID
@@ -69,8 +69,7 @@ class HardwareComponent(HardwareComponentBase):
     updated_at: datetime
     last_seen: datetime
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 class HardwareComponentList(BaseModel):
     components: List[HardwareComponent]
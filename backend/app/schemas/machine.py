@@ -1,6 +1,6 @@
 # backend/app/schemas/machine.py
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from datetime import datetime
 import uuid
 
@@ -27,7 +27,8 @@ class MachineBase(BaseModel):
     position_3d: Dict[str, float] = Field(default_factory=lambda: {"x": 0, "y": 0, "z": 0})
     motherboard_model: str = "generic"
 
-    @validator('ip_address')
+    @field_validator('ip_address')
+    @classmethod
     def validate_ip_address(cls, v):
         import ipaddress
         try:
@@ -65,8 +66,7 @@ class Machine(MachineBase):
     last_metrics_update: Optional[datetime] = None
     api_key: Optional[str] = None
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 class MachineList(BaseModel):
     machines: List[Machine]
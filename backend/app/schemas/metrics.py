@@ -1,6 +1,6 @@
 # backend/app/schemas/metrics.py
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 import uuid
 
@@ -22,8 +22,7 @@ class MetricData(MetricDataBase):
     machine_id: uuid.UUID
     timestamp: datetime
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 class MetricsList(BaseModel):
     metrics: List[MetricData]
@@ -41,7 +40,7 @@ class MetricsQuery(BaseModel):
     size: int = Field(default=100, ge=1, le=1000)
 
 class MetricsExport(BaseModel):
-    format: str = Field(..., regex="^(json|csv|xlsx)$")
+    format: str = Field(..., pattern="^(json|csv|xlsx)$")
     query: MetricsQuery
     include_metadata: bool = True
 
@@ -26,6 +26,7 @@ class AlertManager:
         self.active_alerts: Dict[str, AlertModel] = {}
         self.last_evaluations: Dict[str, datetime] = {}
         self.cooldown_periods: Dict[str, datetime] = {}
+        self.http_session: Optional[aiohttp.ClientSession] = None
         
     async def start(self):
         """Start the alert manager"""
@@ -51,6 +52,10 @@ class AlertManager:
             except asyncio.CancelledError:
                 pass
         
+        if self.http_session and not self.http_session.closed:
+            await self.http_session.close()
+        self.http_session = None
+        
         logger.info("Alert manager stopped")
     
     async def _alert_loop(self):
@@ -344,12 +349,11 @@ Please check the Master Dashboard for more details.
                 ]
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(webhook_url, json=payload) as response:
-                    if response.status == 200:
-                        logger.info(f"Slack notification sent for alert {alert.id}")
-                    else:
-                        logger.error(f"Slack notification failed with status {response.status}")
+            async with self._get_http_session().post(webhook_url, json=payload) as response:
+                if response.status == 200:
+                    logger.info(f"Slack notification sent for alert {alert.id}")
+                else:
+                    logger.error(f"Slack notification failed with status {response.status}")
         
         except Exception as e:
             logger.error(f"Error sending Slack notification: {e}")
@@ -377,16 +381,24 @@ Please check the Master Dashboard for more details.
                 "metadata": alert.metadata
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(webhook_url, json=payload, headers=webhook_headers) as response:
-                    if response.status < 400:
-                        logger.info(f"Webhook notification sent for alert {alert.id}")
-                    else:
-                        logger.error(f"Webhook notification failed with status {response.status}")
+            async with self._get_http_session().post(webhook_url, json=payload, headers=webhook_headers) as response:
+                if response.status < 400:
+                    logger.info(f"Webhook notification sent for alert {alert.id}")
+                else:
+                    logger.error(f"Webhook notification failed with status {response.status}")
         
         except Exception as e:
             logger.error(f"Error sending webhook notification: {e}")
     
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        """Shared session so notifications reuse pooled keep-alive connections"""
+        if self.http_session is None or self.http_session.closed:
+            self.http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=10, keepalive_timeout=75),
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
+        return self.http_session
+    
     async def create_default_alert_rules(self):
         """Create default alert rules for new machines"""
         db = SessionLocal()
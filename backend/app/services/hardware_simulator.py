@@ -12,97 +12,143 @@ from app.models.machine import Machine as MachineModel, MachineType, ConnectionS
 from app.models.metrics import MetricData as MetricModel, MetricType
 from app.models.hardware import HardwareComponent as HardwareModel, ComponentType, ComponentStatus
 from app.core.database import SessionLocal
+from app.core.cache import metrics_cache
 
 logger = logging.getLogger(__name__)
 
+MACHINE_TEMPLATES = [
+    {
+        "name": "Server-01",
+        "type": MachineType.SERVER,
+        "motherboard": "ASUS PRIME X570-PRO",
+        "cpu": {"name": "AMD Ryzen 9 5950X", "cores": 16, "threads": 32, "base_freq": 3.4, "max_freq": 4.9},
+        "gpu": [{"name": "NVIDIA RTX 4090", "vram": 24576, "manufacturer": "NVIDIA"}],
+        "ram": {"total": 32768, "modules": 4, "speed": 3200},
+        "storage": [{"name": "Samsung 980 PRO", "capacity": 1024000, "type": "NVMe"}]
+    },
+    {
+        "name": "Workstation-01",
+        "type": MachineType.WORKSTATION,
+        "motherboard": "MSI MEG X570 GODLIKE",
+        "cpu": {"name": "Intel i9-13900K", "cores": 24, "threads": 32, "base_freq": 3.0, "max_freq": 5.8},
+        "gpu": [{"name": "NVIDIA RTX 4080", "vram": 16384, "manufacturer": "NVIDIA"}],
+        "ram": {"total": 64768, "modules": 8, "speed": 3600},
+        "storage": [{"name": "WD Black SN850X", "capacity": 2048000, "type": "NVMe"}]
+    },
+    {
+        "name": "Gaming-Rig",
+        "type": MachineType.DESKTOP,
+        "motherboard": "Gigabyte Z690 AORUS MASTER",
+        "cpu": {"name": "Intel i7-13700K", "cores": 16, "threads": 24, "base_freq": 3.4, "max_freq": 5.4},
+        "gpu": [{"name": "AMD RX 7900 XTX", "vram": 24576, "manufacturer": "AMD"}],
+        "ram": {"total": 32768, "modules": 4, "speed": 3200},
+        "storage": [{"name": "Corsair MP600 PRO", "capacity": 1024000, "type": "NVMe"}]
+    },
+    {
+        "name": "AI-Server",
+        "type": MachineType.SERVER,
+        "motherboard": "ASUS WS C621E SAGE",
+        "cpu": {"name": "Intel Xeon W-3375", "cores": 38, "threads": 76, "base_freq": 2.5, "max_freq": 4.0},
+        "gpu": [
+            {"name": "NVIDIA A100", "vram": 40960, "manufacturer": "NVIDIA"},
+            {"name": "NVIDIA A100", "vram": 40960, "manufacturer": "NVIDIA"}
+        ],
+        "ram": {"total": 128000, "modules": 16, "speed": 2933},
+        "storage": [{"name": "Intel Optane P5800X", "capacity": 800000, "type": "NVMe"}]
+    },
+    {
+        "name": "Dev-Laptop",
+        "type": MachineType.LAPTOP,
+        "motherboard": "Apple M2 Max",
+        "cpu": {"name": "Apple M2 Max", "cores": 12, "threads": 12, "base_freq": 3.2, "max_freq": 3.7},
+        "gpu": [{"name": "Apple M2 Max GPU", "vram": 32768, "manufacturer": "Apple"}],
+        "ram": {"total": 32768, "modules": 1, "speed": 6400},
+        "storage": [{"name": "Apple SSD", "capacity": 1024000, "type": "NVMe"}]
+    },
+    {
+        "name": "ML-Workstation",
+        "type": MachineType.WORKSTATION,
+        "motherboard": "ASUS Pro WS X570-ACE",
+        "cpu": {"name": "AMD Threadripper PRO 5975WX", "cores": 32, "threads": 64, "base_freq": 3.6, "max_freq": 4.5},
+        "gpu": [
+            {"name": "NVIDIA RTX 4090", "vram": 24576, "manufacturer": "NVIDIA"},
+            {"name": "NVIDIA RTX 4090", "vram": 24576, "manufacturer": "NVIDIA"}
+        ],
+        "ram": {"total": 256000, "modules": 8, "speed": 3200},
+        "storage": [{"name": "Samsung 980 PRO", "capacity": 2048000, "type": "NVMe"}]
+    },
+    {
+        "name": "Edge-Device",
+        "type": MachineType.EMBEDDED,
+        "motherboard": "NVIDIA Jetson AGX Orin",
+        "cpu": {"name": "ARM Cortex-A78AE", "cores": 12, "threads": 12, "base_freq": 2.2, "max_freq": 2.2},
+        "gpu": [{"name": "NVIDIA Ampere GPU", "vram": 32768, "manufacturer": "NVIDIA"}],
+        "ram": {"total": 32768, "modules": 1, "speed": 3200},
+        "storage": [{"name": "SanDisk Industrial", "capacity": 256000, "type": "eMMC"}]
+    },
+    {
+        "name": "Database-Server",
+        "type": MachineType.SERVER,
+        "motherboard": "Supermicro X12SPG-TF",
+        "cpu": {"name": "Intel Xeon Gold 6348", "cores": 28, "threads": 56, "base_freq": 2.6, "max_freq": 3.5},
+        "gpu": [{"name": "NVIDIA T1000", "vram": 4096, "manufacturer": "NVIDIA"}],
+        "ram": {"total": 512000, "modules": 16, "speed": 3200},
+        "storage": [
+            {"name": "Intel DC P4610", "capacity": 1600000, "type": "NVMe"},
+            {"name": "Intel DC P4610", "capacity": 1600000, "type": "NVMe"}
+        ]
+    }
+]
+
+def _static_machine_fields(index: int, template: Dict[str, Any]) -> Dict[str, Any]:
+    """Machine columns that depend only on the template, not on when the simulator starts"""
+    is_server = template["type"] == MachineType.SERVER
+    return {
+        "name": template["name"],
+        "ip_address": f"192.168.1.{100 + index}",
+        "port": 8001,
+        "machine_type": template["type"],
+        "hostname": template["name"].lower().replace("-", ""),
+        "os_name": "Ubuntu" if is_server else "Windows",
+        "os_version": "22.04 LTS" if is_server else "11 Pro",
+        "architecture": "x86_64",
+        "motherboard_model": template["motherboard"].lower().replace(" ", "_"),
+        "hardware_info": {
+            "cpu": template["cpu"],
+            "gpu": template["gpu"],
+            "ram": template["ram"],
+            "storage": template["storage"]
+        }
+    }
+
+MACHINE_STATIC_FIELDS = [_static_machine_fields(i, t) for i, t in enumerate(MACHINE_TEMPLATES)]
+
+def _metric_layout(template: Dict[str, Any]) -> Dict[str, Any]:
+    """Per-tick constants for a template: component names and the CPU frequency range"""
+    base_freq = template["cpu"]["base_freq"]
+    return {
+        "cpu_base_freq": base_freq,
+        "cpu_freq_span": template["cpu"]["max_freq"] - base_freq,
+        "total_memory": template["ram"]["total"],
+        "gpus": [(f"GPU{i}", gpu["vram"]) for i, gpu in enumerate(template["gpu"])],
+        "storage": [f"Storage{i}" for i in range(len(template["storage"]))]
+    }
+
+MACHINE_METRIC_LAYOUTS = [_metric_layout(t) for t in MACHINE_TEMPLATES]
+
 class HardwareSimulator:
     def __init__(self):
         self.is_running = False
         self.machines: Dict[str, Dict] = {}
         self.simulation_task = None
-        self.machine_templates = [
-            {
-                "name": "Server-01",
-                "type": MachineType.SERVER,
-                "motherboard": "ASUS PRIME X570-PRO",
-                "cpu": {"name": "AMD Ryzen 9 5950X", "cores": 16, "threads": 32, "base_freq": 3.4, "max_freq": 4.9},
-                "gpu": [{"name": "NVIDIA RTX 4090", "vram": 24576, "manufacturer": "NVIDIA"}],
-                "ram": {"total": 32768, "modules": 4, "speed": 3200},
-                "storage": [{"name": "Samsung 980 PRO", "capacity": 1024000, "type": "NVMe"}]
-            },
-            {
-                "name": "Workstation-01",
-                "type": MachineType.WORKSTATION,
-                "motherboard": "MSI MEG X570 GODLIKE",
-                "cpu": {"name": "Intel i9-13900K", "cores": 24, "threads": 32, "base_freq": 3.0, "max_freq": 5.8},
-                "gpu": [{"name": "NVIDIA RTX 4080", "vram": 16384, "manufacturer": "NVIDIA"}],
-                "ram": {"total": 64768, "modules": 8, "speed": 3600},
-                "storage": [{"name": "WD Black SN850X", "capacity": 2048000, "type": "NVMe"}]
-            },
-            {
-                "name": "Gaming-Rig",
-                "type": MachineType.DESKTOP,
-                "motherboard": "Gigabyte Z690 AORUS MASTER",
-                "cpu": {"name": "Intel i7-13700K", "cores": 16, "threads": 24, "base_freq": 3.4, "max_freq": 5.4},
-                "gpu": [{"name": "AMD RX 7900 XTX", "vram": 24576, "manufacturer": "AMD"}],
-                "ram": {"total": 32768, "modules": 4, "speed": 3200},
-                "storage": [{"name": "Corsair MP600 PRO", "capacity": 1024000, "type": "NVMe"}]
-            },
-            {
-                "name": "AI-Server",
-                "type": MachineType.SERVER,
-                "motherboard": "ASUS WS C621E SAGE",
-                "cpu": {"name": "Intel Xeon W-3375", "cores": 38, "threads": 76, "base_freq": 2.5, "max_freq": 4.0},
-                "gpu": [
-                    {"name": "NVIDIA A100", "vram": 40960, "manufacturer": "NVIDIA"},
-                    {"name": "NVIDIA A100", "vram": 40960, "manufacturer": "NVIDIA"}
-                ],
-                "ram": {"total": 128000, "modules": 16, "speed": 2933},
-                "storage": [{"name": "Intel Optane P5800X", "capacity": 800000, "type": "NVMe"}]
-            },
-            {
-                "name": "Dev-Laptop",
-                "type": MachineType.LAPTOP,
-                "motherboard": "Apple M2 Max",
-                "cpu": {"name": "Apple M2 Max", "cores": 12, "threads": 12, "base_freq": 3.2, "max_freq": 3.7},
-                "gpu": [{"name": "Apple M2 Max GPU", "vram": 32768, "manufacturer": "Apple"}],
-                "ram": {"total": 32768, "modules": 1, "speed": 6400},
-                "storage": [{"name": "Apple SSD", "capacity": 1024000, "type": "NVMe"}]
-            },
-            {
-                "name": "ML-Workstation",
-                "type": MachineType.WORKSTATION,
-                "motherboard": "ASUS Pro WS X570-ACE",
-                "cpu": {"name": "AMD Threadripper PRO 5975WX", "cores": 32, "threads": 64, "base_freq": 3.6, "max_freq": 4.5},
-                "gpu": [
-                    {"name": "NVIDIA RTX 4090", "vram": 24576, "manufacturer": "NVIDIA"},
-                    {"name": "NVIDIA RTX 4090", "vram": 24576, "manufacturer": "NVIDIA"}
-                ],
-                "ram": {"total": 256000, "modules": 8, "speed": 3200},
-                "storage": [{"name": "Samsung 980 PRO", "capacity": 2048000, "type": "NVMe"}]
-            },
-            {
-                "name": "Edge-Device",
-                "type": MachineType.EMBEDDED,
-                "motherboard": "NVIDIA Jetson AGX Orin",
-                "cpu": {"name": "ARM Cortex-A78AE", "cores": 12, "threads": 12, "base_freq": 2.2, "max_freq": 2.2},
-                "gpu": [{"name": "NVIDIA Ampere GPU", "vram": 32768, "manufacturer": "NVIDIA"}],
-                "ram": {"total": 32768, "modules": 1, "speed": 3200},
-                "storage": [{"name": "SanDisk Industrial", "capacity": 256000, "type": "eMMC"}]
-            },
-            {
-                "name": "Database-Server",
-                "type": MachineType.SERVER,
-                "motherboard": "Supermicro X12SPG-TF",
-                "cpu": {"name": "Intel Xeon Gold 6348", "cores": 28, "threads": 56, "base_freq": 2.6, "max_freq": 3.5},
-                "gpu": [{"name": "NVIDIA T1000", "vram": 4096, "manufacturer": "NVIDIA"}],
-                "ram": {"total": 512000, "modules": 16, "speed": 3200},
-                "storage": [
-                    {"name": "Intel DC P4610", "capacity": 1600000, "type": "NVMe"},
-                    {"name": "Intel DC P4610", "capacity": 1600000, "type": "NVMe"}
-                ]
-            }
-        ]
+        self.writer_task = None
+        self.machine_templates = MACHINE_TEMPLATES
+        
+        # Generated batches waiting for the database; bounded so a slow database drops the oldest ticks
+        self._write_queue = None
+        self._write_queue_size = 8
+        # How long stop() waits for pending batches to reach the database
+        self._write_drain_timeout = 10.0
     
     async def start(self):
         """Start the hardware simulator"""
@@ -115,7 +161,9 @@ class HardwareSimulator:
         # Initialize simulated machines
         await self._initialize_machines()
         
-        # Start simulation loop
+        # Start simulation loop, with storage in its own task so a slow commit can't delay the next tick
+        self._write_queue = asyncio.Queue(maxsize=self._write_queue_size)
+        self.writer_task = asyncio.create_task(self._writer_loop())
         self.simulation_task = asyncio.create_task(self._simulation_loop())
         
         logger.info(f"Hardware simulator started with {len(self.machines)} machines")
@@ -131,36 +179,40 @@ class HardwareSimulator:
             except asyncio.CancelledError:
                 pass
         
+        if self.writer_task:
+            # No new batches can arrive now; let the writer store what is already queued
+            try:
+                await asyncio.wait_for(self._write_queue.join(), timeout=self._write_drain_timeout)
+            except asyncio.TimeoutError:
+                logger.warning(
+                    f"Gave up on {self._write_queue.qsize()} unwritten simulated metric batches after "
+                    f"{self._write_drain_timeout}s"
+                )
+            
+            self.writer_task.cancel()
+            try:
+                await self.writer_task
+            except asyncio.CancelledError:
+                pass
+        
         logger.info("Hardware simulator stopped")
     
     async def _initialize_machines(self):
         """Initialize simulated machines in database"""
         db = SessionLocal()
         try:
+            current_time = datetime.utcnow()
+            
             # Create machines from templates
             for i, template in enumerate(self.machine_templates[:settings.SIMULATOR_MACHINE_COUNT]):
                 machine_id = str(uuid.uuid4())
                 
                 # Create machine in database
                 machine_data = {
+                    **MACHINE_STATIC_FIELDS[i],
                     "id": machine_id,
-                    "name": template["name"],
-                    "ip_address": f"192.168.1.{100 + i}",
-                    "port": 8001,
-                    "machine_type": template["type"],
                     "status": ConnectionStatus.ONLINE,
-                    "hostname": template["name"].lower().replace("-", ""),
-                    "os_name": "Ubuntu" if template["type"] == MachineType.SERVER else "Windows",
-                    "os_version": "22.04 LTS" if template["type"] == MachineType.SERVER else "11 Pro",
-                    "architecture": "x86_64",
-                    "motherboard_model": template["motherboard"].lower().replace(" ", "_"),
-                    "last_seen": datetime.utcnow(),
-                    "hardware_info": {
-                        "cpu": template["cpu"],
-                        "gpu": template["gpu"],
-                        "ram": template["ram"],
-                        "storage": template["storage"]
-                    }
+                    "last_seen": current_time
                 }
                 
                 # Check if machine already exists
@@ -178,6 +230,7 @@ class HardwareSimulator:
                 # Store machine state for simulation
                 self.machines[machine_id] = {
                     "template": template,
+                    "layout": MACHINE_METRIC_LAYOUTS[i],
                     "state": {
                         "cpu_usage": random.uniform(10, 30),
                         "memory_usage": random.uniform(20, 40),
@@ -188,7 +241,7 @@ class HardwareSimulator:
                             "motherboard": random.uniform(25, 35)
                         },
                         "workload_pattern": random.choice(["idle", "normal", "burst", "sustained"]),
-                        "last_pattern_change": datetime.utcnow()
+                        "last_pattern_change": current_time
                     }
                 }
             
@@ -204,8 +257,10 @@ class HardwareSimulator:
         """Main simulation loop"""
         while self.is_running:
             try:
-                await self._update_machine_states()
-                await self._generate_metrics()
+                # One clock read per tick, shared by the state update and the metric rows
+                current_time = datetime.utcnow()
+                await self._update_machine_states(current_time)
+                self._enqueue_metrics(self._generate_metrics(current_time))
                 await asyncio.sleep(settings.SIMULATOR_UPDATE_INTERVAL)
             except asyncio.CancelledError:
                 break
@@ -213,10 +268,16 @@ class HardwareSimulator:
                 logger.error(f"Error in simulation loop: {e}")
                 await asyncio.sleep(5)
     
-    async def _update_machine_states(self):
+    def _enqueue_metrics(self, metrics_batch: List[MetricModel]):
+        """Hand a batch to the writer, discarding the oldest pending batch if it has fallen behind"""
+        if self._write_queue.full():
+            self._write_queue.get_nowait()
+            self._write_queue.task_done()
+            logger.warning("Simulated metrics writer is behind; dropped the oldest pending batch")
+        self._write_queue.put_nowait(metrics_batch)
+    
+    async def _update_machine_states(self, current_time: datetime):
         """Update machine states with realistic patterns"""
-        current_time = datetime.utcnow()
-        
         for machine_id, machine_data in self.machines.items():
             state = machine_data["state"]
             template = machine_data["template"]
@@ -266,190 +327,205 @@ class HardwareSimulator:
             
             state["temperatures"]["motherboard"] = base_temp * 0.7 + random.uniform(-2, 3)
     
-    async def _generate_metrics(self):
+    def _generate_metrics(self, current_time: datetime) -> List[MetricModel]:
         """Generate realistic metrics for all machines"""
-        db = SessionLocal()
-        try:
-            current_time = datetime.utcnow()
-            metrics_batch = []
+        metrics_batch = []
+        
+        for machine_id, machine_data in self.machines.items():
+            state = machine_data["state"]
+            layout = machine_data["layout"]
             
-            for machine_id, machine_data in self.machines.items():
-                state = machine_data["state"]
-                template = machine_data["template"]
-                
-                # CPU metrics
-                metrics_batch.extend([
-                    MetricModel(
-                        machine_id=machine_id,
-                        metric_type=MetricType.CPU_USAGE,
-                        component_name="CPU",
-                        value=state["cpu_usage"],
-                        unit="%",
-                        timestamp=current_time
-                    ),
-                    MetricModel(
-                        machine_id=machine_id,
-                        metric_type=MetricType.CPU_TEMPERATURE,
-                        component_name="CPU",
-                        value=state["temperatures"]["cpu"],
-                        unit="°C",
-                        timestamp=current_time
-                    ),
-                    MetricModel(
-                        machine_id=machine_id,
-                        metric_type=MetricType.CPU_FREQUENCY,
-                        component_name="CPU",
-                        value=template["cpu"]["base_freq"] + (state["cpu_usage"] / 100) * (template["cpu"]["max_freq"] - template["cpu"]["base_freq"]),
-                        unit="GHz",
-                        timestamp=current_time
-                    )
-                ])
-                
-                # Memory metrics
-                total_memory = template["ram"]["total"]
-                used_memory = (state["memory_usage"] / 100) * total_memory
-                metrics_batch.extend([
-                    MetricModel(
-                        machine_id=machine_id,
-                        metric_type=MetricType.MEMORY_USAGE,
-                        component_name="RAM",
-                        value=state["memory_usage"],
-                        unit="%",
-                        timestamp=current_time
-                    ),
-                    MetricModel(
-                        machine_id=machine_id,
-                        metric_type=MetricType.MEMORY_AVAILABLE,
-                        component_name="RAM",
-                        value=total_memory - used_memory,
-                        unit="MB",
-                        timestamp=current_time
-                    )
-                ])
-                
-                # GPU metrics
-                if template["gpu"]:
-                    for i, gpu in enumerate(template["gpu"]):
-                        gpu_usage = state.get("gpu_usage", 0) + random.uniform(-5, 5)
-                        gpu_usage = max(0, min(100, gpu_usage))
-                        
-                        metrics_batch.extend([
-                            MetricModel(
-                                machine_id=machine_id,
-                                metric_type=MetricType.GPU_USAGE,
-                                component_name=f"GPU{i}",
-                                value=gpu_usage,
-                                unit="%",
-                                timestamp=current_time
-                            ),
-                            MetricModel(
-                                machine_id=machine_id,
-                                metric_type=MetricType.GPU_MEMORY,
-                                component_name=f"GPU{i}",
-                                value=(gpu_usage / 100) * gpu["vram"],
-                                unit="MB",
-                                timestamp=current_time
-                            ),
-                            MetricModel(
-                                machine_id=machine_id,
-                                metric_type=MetricType.GPU_TEMPERATURE,
-                                component_name=f"GPU{i}",
-                                value=state["temperatures"].get("gpu", 40),
-                                unit="°C",
-                                timestamp=current_time
-                            )
-                        ])
-                
-                # Storage metrics
-                for i, storage in enumerate(template["storage"]):
-                    usage_percent = random.uniform(30, 80)
+            # CPU metrics
+            metrics_batch.extend([
+                MetricModel(
+                    machine_id=machine_id,
+                    metric_type=MetricType.CPU_USAGE,
+                    component_name="CPU",
+                    value=state["cpu_usage"],
+                    unit="%",
+                    timestamp=current_time
+                ),
+                MetricModel(
+                    machine_id=machine_id,
+                    metric_type=MetricType.CPU_TEMPERATURE,
+                    component_name="CPU",
+                    value=state["temperatures"]["cpu"],
+                    unit="°C",
+                    timestamp=current_time
+                ),
+                MetricModel(
+                    machine_id=machine_id,
+                    metric_type=MetricType.CPU_FREQUENCY,
+                    component_name="CPU",
+                    value=layout["cpu_base_freq"] + (state["cpu_usage"] / 100) * layout["cpu_freq_span"],
+                    unit="GHz",
+                    timestamp=current_time
+                )
+            ])
+            
+            # Memory metrics
+            total_memory = layout["total_memory"]
+            used_memory = (state["memory_usage"] / 100) * total_memory
+            metrics_batch.extend([
+                MetricModel(
+                    machine_id=machine_id,
+                    metric_type=MetricType.MEMORY_USAGE,
+                    component_name="RAM",
+                    value=state["memory_usage"],
+                    unit="%",
+                    timestamp=current_time
+                ),
+                MetricModel(
+                    machine_id=machine_id,
+                    metric_type=MetricType.MEMORY_AVAILABLE,
+                    component_name="RAM",
+                    value=total_memory - used_memory,
+                    unit="MB",
+                    timestamp=current_time
+                )
+            ])
+            
+            # GPU metrics
+            if layout["gpus"]:
+                for gpu_name, vram in layout["gpus"]:
+                    gpu_usage = state.get("gpu_usage", 0) + random.uniform(-5, 5)
+                    gpu_usage = max(0, min(100, gpu_usage))
+                    
                     metrics_batch.extend([
                         MetricModel(
                             machine_id=machine_id,
-                            metric_type=MetricType.DISK_USAGE,
-                            component_name=f"Storage{i}",
-                            value=usage_percent,
+                            metric_type=MetricType.GPU_USAGE,
+                            component_name=gpu_name,
+                            value=gpu_usage,
                             unit="%",
                             timestamp=current_time
                         ),
                         MetricModel(
                             machine_id=machine_id,
-                            metric_type=MetricType.DISK_IO_READ,
-                            component_name=f"Storage{i}",
-                            value=random.uniform(10, 500),
-                            unit="MB/s",
+                            metric_type=MetricType.GPU_MEMORY,
+                            component_name=gpu_name,
+                            value=(gpu_usage / 100) * vram,
+                            unit="MB",
                             timestamp=current_time
                         ),
                         MetricModel(
                             machine_id=machine_id,
-                            metric_type=MetricType.DISK_IO_WRITE,
-                            component_name=f"Storage{i}",
-                            value=random.uniform(5, 200),
-                            unit="MB/s",
+                            metric_type=MetricType.GPU_TEMPERATURE,
+                            component_name=gpu_name,
+                            value=state["temperatures"].get("gpu", 40),
+                            unit="°C",
                             timestamp=current_time
                         )
                     ])
-                
-                # Network metrics
+            
+            # Storage metrics
+            for storage_name in layout["storage"]:
+                usage_percent = random.uniform(30, 80)
                 metrics_batch.extend([
                     MetricModel(
                         machine_id=machine_id,
-                        metric_type=MetricType.NETWORK_IO_SENT,
-                        component_name="eth0",
-                        value=random.uniform(1, 100),
-                        unit="MB/s",
+                        metric_type=MetricType.DISK_USAGE,
+                        component_name=storage_name,
+                        value=usage_percent,
+                        unit="%",
                         timestamp=current_time
                     ),
                     MetricModel(
                         machine_id=machine_id,
-                        metric_type=MetricType.NETWORK_IO_RECV,
-                        component_name="eth0",
-                        value=random.uniform(1, 50),
+                        metric_type=MetricType.DISK_IO_READ,
+                        component_name=storage_name,
+                        value=random.uniform(10, 500),
                         unit="MB/s",
                         timestamp=current_time
-                    )
-                ])
-                
-                # System metrics
-                metrics_batch.extend([
-                    MetricModel(
-                        machine_id=machine_id,
-                        metric_type=MetricType.PROCESS_COUNT,
-                        component_name="System",
-                        value=random.randint(150, 400),
-                        unit="count",
-                        timestamp=current_time
-                    ),
-                    MetricModel(
-                        machine_id=machine_id,
-                        metric_type=MetricType.UPTIME,
-                        component_name="System",
-                        value=random.randint(100000, 1000000),
-                        unit="seconds",
-                        timestamp=current_time
                     ),
                     MetricModel(
                         machine_id=machine_id,
-                        metric_type=MetricType.POWER_CONSUMPTION,
-                        component_name="System",
-                        value=100 + (state["cpu_usage"] * 2) + (state.get("gpu_usage", 0) * 3),
-                        unit="W",
+                        metric_type=MetricType.DISK_IO_WRITE,
+                        component_name=storage_name,
+                        value=random.uniform(5, 200),
+                        unit="MB/s",
                         timestamp=current_time
                     )
                 ])
             
-            # Batch insert metrics
+            # Network metrics
+            metrics_batch.extend([
+                MetricModel(
+                    machine_id=machine_id,
+                    metric_type=MetricType.NETWORK_IO_SENT,
+                    component_name="eth0",
+                    value=random.uniform(1, 100),
+                    unit="MB/s",
+                    timestamp=current_time
+                ),
+                MetricModel(
+                    machine_id=machine_id,
+                    metric_type=MetricType.NETWORK_IO_RECV,
+                    component_name="eth0",
+                    value=random.uniform(1, 50),
+                    unit="MB/s",
+                    timestamp=current_time
+                )
+            ])
+            
+            # System metrics
+            metrics_batch.extend([
+                MetricModel(
+                    machine_id=machine_id,
+                    metric_type=MetricType.PROCESS_COUNT,
+                    component_name="System",
+                    value=random.randint(150, 400),
+                    unit="count",
+                    timestamp=current_time
+                ),
+                MetricModel(
+                    machine_id=machine_id,
+                    metric_type=MetricType.UPTIME,
+                    component_name="System",
+                    value=random.randint(100000, 1000000),
+                    unit="seconds",
+                    timestamp=current_time
+                ),
+                MetricModel(
+                    machine_id=machine_id,
+                    metric_type=MetricType.POWER_CONSUMPTION,
+                    component_name="System",
+                    value=100 + (state["cpu_usage"] * 2) + (state.get("gpu_usage", 0) * 3),
+                    unit="W",
+                    timestamp=current_time
+                )
+            ])
+        
+        return metrics_batch
+    
+    def _write_metrics(self, metrics_batch: List[MetricModel]) -> bool:
+        """Insert a batch of metrics; runs on a worker thread"""
+        # Keep attributes loaded after commit so the cache update doesn't re-select every row
+        db = SessionLocal(expire_on_commit=False)
+        try:
             db.add_all(metrics_batch)
             db.commit()
-            
-            logger.debug(f"Generated {len(metrics_batch)} metrics for {len(self.machines)} machines")
-            
+            return True
         except Exception as e:
-            logger.error(f"Error generating metrics: {e}")
+            logger.error(f"Error writing simulated metrics: {e}")
             db.rollback()
+            return False
         finally:
             db.close()
     
+    async def _writer_loop(self):
+        """Persist generated batches off the simulation tick"""
+        while True:
+            metrics_batch = await self._write_queue.get()
+            try:
+                if await asyncio.to_thread(self._write_metrics, metrics_batch):
+                    await metrics_cache.store_latest(metrics_batch)
+                    logger.debug(f"Stored {len(metrics_batch)} simulated metrics")
+            except Exception as e:
+                logger.error(f"Error storing simulated metrics: {e}")
+            finally:
+                self._write_queue.task_done()
+    
     def get_machine_count(self) -> int:
         """Get number of simulated machines"""
         return len(self.machines)
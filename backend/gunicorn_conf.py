@@ -0,0 +1,38 @@
+# backend/gunicorn_conf.py
+"""
+Gunicorn configuration for production deployments.
+
+Usage (from the backend directory): gunicorn -c gunicorn_conf.py app.main:app
+
+The WebSocket connection registry, hardware simulator, metrics processor and
+alert manager all live in-process, so every worker runs its own copy of them.
+WEB_CONCURRENCY therefore defaults to a single worker. Raising it (up to
+2 * CPU cores + 1) is only safe once that state is shared between workers;
+until then each worker generates its own simulated metrics and clients only
+see broadcasts from the worker they are connected to.
+"""
+import os
+
+from uvicorn.workers import UvicornWorker
+
+class DashboardUvicornWorker(UvicornWorker):
+    # Metric/event frames are small; permessage-deflate costs more CPU than it saves unless bandwidth is scarce
+    CONFIG_KWARGS = {
+        **UvicornWorker.CONFIG_KWARGS,
+        "ws_per_message_deflate": os.getenv("WS_PER_MESSAGE_DEFLATE", "false").lower() in ("1", "true", "yes")
+    }
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+worker_class = "gunicorn_conf.DashboardUvicornWorker"
+workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+
+worker_connections = 1000
+keepalive = 5
+timeout = 120
+graceful_timeout = 30
+
+# Per-request access logging is a measurable throughput cost; keep it for development only
+is_production = os.getenv("ENVIRONMENT", "development") == "production"
+accesslog = None if is_production else "-"
+errorlog = "-"
+loglevel = os.getenv("LOG_LEVEL", "warning" if is_production else "info")
@@ -6,13 +6,24 @@ Collects system metrics and sends them to the Master Dashboard server
 import asyncio
 import json
 import platform
+import random
+import socket
 import sys
+import time
+from collections import deque
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
+from urllib.parse import urlparse
 import yaml
 import logging
 from datetime import datetime, timezone
 
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 from collectors.system_metrics import SystemMetricsCollector
 from collectors.hardware_sensors import HardwareSensorsCollector
 from collectors.network_stats import NetworkStatsCollector
@@ -21,6 +32,48 @@ from communication.http_client import HTTPClient
 from utils.logger import setup_logger
 from utils.crypto import generate_machine_id
 
+def _sample_to_metrics(sample: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Flatten one collected sample into the server's metric rows (MetricDataBase)"""
+    metrics = []
+    
+    def add(metric_type: str, value: Any, unit: Optional[str], component: Optional[str]):
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            metrics.append({
+                'metric_type': metric_type,
+                'component_name': component,
+                'value': float(value),
+                'unit': unit
+            })
+    
+    system = sample.get('system') or {}
+    cpu = system.get('cpu') or {}
+    add('cpu_usage', cpu.get('usage_percent'), '%', 'CPU')
+    freq = (cpu.get('frequency') or {}).get('current')
+    if freq:
+        add('cpu_frequency', freq / 1000, 'GHz', 'CPU')
+    if cpu.get('load_average'):
+        add('load_average', cpu['load_average'][0], None, 'System')
+    
+    memory = (system.get('memory') or {}).get('virtual') or {}
+    add('memory_usage', memory.get('percent'), '%', 'RAM')
+    if memory.get('available') is not None:
+        add('memory_available', memory['available'] / 1048576, 'MB', 'RAM')
+    
+    for device, usage in ((system.get('disk') or {}).get('usage') or {}).items():
+        add('disk_usage', usage.get('percent'), '%', device)
+    
+    add('uptime', system.get('uptime'), 'seconds', 'System')
+    
+    for gpu in ((sample.get('hardware') or {}).get('gpu') or {}).values():
+        add('gpu_temperature', (gpu.get('temperature') or {}).get('current'), '°C', gpu.get('name'))
+    
+    rates = ((sample.get('network') or {}).get('rates') or {}).get('interfaces') or {}
+    for interface, rate in rates.items():
+        add('network_io_sent', rate.get('bytes_sent_per_sec', 0) / 1048576, 'MB/s', interface)
+        add('network_io_recv', rate.get('bytes_recv_per_sec', 0) / 1048576, 'MB/s', interface)
+    
+    return metrics
+
 class MasterDashboardAgent:
     """Main agent class that orchestrates metric collection and transmission"""
     
@@ -48,7 +101,41 @@ class MasterDashboardAgent:
         
         # Machine identification
         self.machine_id = generate_machine_id()
+        self._server_machine_id: Optional[str] = None  # UUID assigned by the server at registration
         self.machine_info = self._get_machine_info()
+        self._identity = {
+            'machine_id': self.machine_id,
+            'hostname': self.machine_info['hostname']
+        }
+        
+        # Samples waiting for delivery (over WebSocket, or batched over HTTP)
+        collection_config = self.config.get('collection', {})
+        self._interval = collection_config.get('interval', 5)
+        self._batch_size = collection_config.get('batch_size', 10)
+        self._flush_every = collection_config.get('flush_every', 60)
+        self._buffer: deque = deque(maxlen=collection_config.get('max_buffered', self._batch_size * 10))
+        self._last_flush = time.monotonic()
+        self._flush_backoff = 0
+        self._next_flush_retry = 0.0
+        self._register_backoff = 0
+        self._stop_event = asyncio.Event()
+        self._pending = asyncio.Event()
+        self._send_lock = asyncio.Lock()
+        
+        # The config is fixed for the agent's lifetime, so resolve the enabled collectors once
+        config_metrics = collection_config.get('metrics', {})
+        self._collectors = [
+            (name, collector) for name, collector in (
+                ('system', self.system_collector),
+                ('hardware', self.hardware_collector),
+                ('network', self.network_collector)
+            )
+            if config_metrics.get(name, True)
+        ]
+        
+        # A collector that just failed is skipped for a while and its last error reported instead
+        self._failed: Dict[str, tuple] = {}
+        self._failure_ttl = collection_config.get('failure_retry', 60)
         
         self.running = False
         
@@ -93,13 +180,30 @@ class MasterDashboardAgent:
         return {
             'machine_id': self.machine_id,
             'hostname': platform.node(),
+            'ip_address': self._get_local_ip(),
             'platform': platform.platform(),
             'system': platform.system(),
+            'os_name': platform.system(),
+            'os_version': platform.release(),
             'architecture': platform.architecture()[0],
             'processor': platform.processor(),
             'python_version': platform.python_version()
         }
     
+    def _get_local_ip(self) -> str:
+        """Get the address this machine uses to reach the server; the server keys machines on it"""
+        host = urlparse(self.config['server']['url']).hostname or 'localhost'
+        try:
+            # Connecting a UDP socket sends nothing, it only selects the outgoing interface
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as probe:
+                probe.connect((host, 80))
+                return probe.getsockname()[0]
+        except OSError:
+            try:
+                return socket.gethostbyname(socket.gethostname())
+            except OSError:
+                return '127.0.0.1'
+    
     async def start(self):
         """Start the monitoring agent"""
         self.logger.info(f"Starting Master Dashboard Agent on {self.machine_info['hostname']}")
@@ -114,62 +218,98 @@ class MasterDashboardAgent:
                 url=self.config['server']['websocket_url'],
                 machine_id=self.machine_id,
                 api_key=self.config['authentication']['api_key'],
-                logger=self.logger
+                logger=self.logger,
+                compression=self.config['server'].get('websocket_compression', False)
             )
             await self.ws_client.connect()
         
         self.running = True
         
-        # Start main monitoring loop
-        await self._monitoring_loop()
+        # Sample on schedule and deliver independently, so a slow server never delays collection
+        await asyncio.gather(self._monitoring_loop(), self._sender_loop(), self._registration_loop())
     
     async def stop(self):
         """Stop the monitoring agent"""
         self.logger.info("Stopping Master Dashboard Agent")
         self.running = False
+        self._stop_event.set()
+        self._pending.set()
+        
+        # Push out anything still buffered before the sessions go away
+        try:
+            async with self._send_lock:
+                await self._flush_metrics(force=True)
+        except Exception as e:
+            self.logger.error(f"Error flushing buffered metrics: {e}")
         
         if self.ws_client:
             await self.ws_client.disconnect()
+        
+        await self.http_client.close()
     
-    async def _register_machine(self):
+    async def _register_machine(self) -> bool:
         """Register this machine with the server"""
         try:
             response = await self.http_client.post('/api/v1/machines/register', {
                 'machine_info': self.machine_info,
-                'agent_version': '1.0.0',
-                'capabilities': {
-                    'system_metrics': True,
-                    'hardware_sensors': True,
-                    'network_stats': True
-                }
+                'hardware_info': {
+                    'capabilities': {
+                        'system_metrics': True,
+                        'hardware_sensors': True,
+                        'network_stats': True
+                    }
+                },
+                'client_version': '1.0.0'
             })
             
-            if response.get('success'):
-                self.logger.info("Machine registered successfully")
-            else:
-                self.logger.warning(f"Machine registration failed: {response.get('error')}")
+            # The server answers with the machine record; its id addresses our HTTP metric batches
+            if response.get('id'):
+                self._server_machine_id = response['id']
+                self.logger.info(f"Machine registered successfully as {self._server_machine_id}")
+                return True
+            
+            self.logger.warning(f"Machine registration failed: {response.get('error')}")
                 
         except Exception as e:
             self.logger.error(f"Failed to register machine: {e}")
+        
+        return False
+    
+    async def _registration_loop(self):
+        """Retry a failed registration with backoff, away from the send path"""
+        while self.running and self._server_machine_id is None:
+            interval = self._interval
+            self._register_backoff = min(self._register_backoff * 2 or interval, 300)
+            await self._wait(self._register_backoff + random.uniform(0, interval))
+            
+            if self.running and await self._register_machine():
+                # Samples buffered meanwhile can go out over HTTP now
+                self._pending.set()
     
     async def _collect_metrics(self) -> Dict[str, Any]:
         """Collect all enabled metrics"""
         metrics = {
-            'timestamp': datetime.now(timezone.utc).isoformat(),
-            'machine_id': self.machine_id
+            **self._identity,
+            'timestamp': datetime.now(timezone.utc).isoformat(timespec='milliseconds')
         }
         
-        config_metrics = self.config['collection']['metrics']
+        now = time.monotonic()
+        active = []
+        for name, collector in self._collectors:
+            failure = self._failed.get(name)
+            if failure and now - failure[0] < self._failure_ttl:
+                metrics[name] = failure[1]
+            else:
+                active.append((name, collector))
         
         try:
-            if config_metrics.get('system', True):
-                metrics['system'] = await self.system_collector.collect()
-            
-            if config_metrics.get('hardware', True):
-                metrics['hardware'] = await self.hardware_collector.collect()
-            
-            if config_metrics.get('network', True):
-                metrics['network'] = await self.network_collector.collect()
+            results = await asyncio.gather(*(collector.collect() for _, collector in active))
+            for (name, _), result in zip(active, results):
+                metrics[name] = result
+                if 'error' in result:
+                    self._failed[name] = (now, result)
+                else:
+                    self._failed.pop(name, None)
                 
         except Exception as e:
             self.logger.error(f"Error collecting metrics: {e}")
@@ -177,46 +317,118 @@ class MasterDashboardAgent:
         
         return metrics
     
-    async def _send_metrics(self, metrics: Dict[str, Any]):
-        """Send metrics to the server"""
+    async def _send_metrics(self):
+        """Send buffered metrics to the server"""
         try:
             # Try WebSocket first if available
             if self.ws_client and self.ws_client.is_connected():
-                await self.ws_client.send_metrics(metrics)
-                return
+                while self._buffer:
+                    metrics = self._buffer[0]
+                    if not await self.ws_client.send_metrics(metrics):
+                        break
+                    if self._buffer and self._buffer[0] is metrics:
+                        self._buffer.popleft()
+                
+                if not self._buffer:
+                    return
             
-            # Fallback to HTTP
-            response = await self.http_client.post('/api/v1/metrics', metrics)
-            if not response.get('success'):
-                self.logger.warning(f"HTTP metrics send failed: {response.get('error')}")
+            # Fallback to HTTP, batching samples into a single request
+            await self._flush_metrics()
                 
         except Exception as e:
             self.logger.error(f"Failed to send metrics: {e}")
     
+    async def _flush_metrics(self, force: bool = False):
+        """Send buffered metrics as one batch once enough samples or time have accumulated"""
+        if not self._buffer:
+            return
+        
+        now = time.monotonic()
+        if not force:
+            if now < self._next_flush_retry:
+                return
+            if len(self._buffer) < self._batch_size and now - self._last_flush < self._flush_every:
+                return
+        
+        # Batches are addressed by the server's id; until _registration_loop obtains it, keep buffering
+        if self._server_machine_id is None:
+            return
+        
+        batch = list(self._buffer)
+        response = await self.http_client.send_metrics_batch([
+            {
+                'machine_id': self._server_machine_id,
+                'timestamp': sample['timestamp'],
+                'metrics': _sample_to_metrics(sample)
+            }
+            for sample in batch
+        ])
+        
+        delivered = response['sent']
+        if not response['success'] and not response.get('retryable', True):
+            # The server will never accept these samples; retrying would only loop forever
+            self.logger.warning(f"Dropping {len(batch) - delivered} buffered samples rejected by the server: {response.get('error')}")
+            delivered = len(batch)
+        
+        # Samples may have been evicted or appended while the request was in flight
+        done = {id(metrics) for metrics in batch[:delivered]}
+        while self._buffer and id(self._buffer[0]) in done:
+            self._buffer.popleft()
+        
+        if delivered == len(batch):
+            self._last_flush = now
+            self._flush_backoff = 0
+            self._next_flush_retry = 0.0
+        else:
+            # Keep the samples and retry later with exponential backoff plus jitter
+            interval = self._interval
+            self._flush_backoff = min(self._flush_backoff * 2 or interval, 300)
+            self._next_flush_retry = now + self._flush_backoff + random.uniform(0, interval)
+    
     async def _monitoring_loop(self):
         """Main monitoring loop"""
-        interval = self.config['collection']['interval']
+        interval = self._interval
         
         while self.running:
             try:
                 # Collect metrics
                 metrics = await self._collect_metrics()
                 
-                # Send metrics
-                await self._send_metrics(metrics)
+                # Hand off to the sender
+                self._buffer.append(metrics)
+                self._pending.set()
                 
                 # Log successful collection
                 if 'error' not in metrics:
-                    self.logger.debug(f"Metrics collected and sent successfully")
+                    self.logger.debug(f"Metrics collected and queued for sending")
                 
                 # Wait for next collection
-                await asyncio.sleep(interval)
+                await self._wait(interval)
                 
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 self.logger.error(f"Error in monitoring loop: {e}")
-                await asyncio.sleep(interval)
+                await self._wait(interval)
+    
+    async def _sender_loop(self):
+        """Deliver buffered metrics whenever the monitoring loop queues new samples"""
+        while self.running:
+            await self._pending.wait()
+            self._pending.clear()
+            
+            if not self.running:
+                break
+            
+            async with self._send_lock:
+                await self._send_metrics()
+    
+    async def _wait(self, interval: float):
+        """Sleep until the next collection, waking early if stop() is called"""
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), timeout=interval)
+        except asyncio.TimeoutError:
+            pass
 
 async def main():
     """Main entry point"""
@@ -240,5 +452,8 @@ if __name__ == "__main__":
     if platform.system() == "Windows":
         # Windows specific event loop policy
         asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+    elif UVLOOP_AVAILABLE:
+        # libuv-backed loop for lower per-await overhead on Linux/macOS
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     
     asyncio.run(main())
\ No newline at end of file
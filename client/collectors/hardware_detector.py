@@ -4,6 +4,7 @@ Automatically detects and identifies all available hardware components including
 CPU, GPU, TPU, RAM, storage, network interfaces, and specialized accelerators
 """
 import asyncio
+import glob
 import platform
 import subprocess
 import json
@@ -31,6 +32,21 @@ try:
 except ImportError:
     DISTRO_AVAILABLE = False
 
+try:
+    import winreg
+    WINREG_AVAILABLE = True
+except ImportError:
+    WINREG_AVAILABLE = False
+
+# wProcessorArchitecture values reported by GetSystemInfo
+WINDOWS_PROCESSOR_ARCHITECTURES = {
+    0: 'x86',
+    5: 'ARM',
+    6: 'IA64',
+    9: 'AMD64',
+    12: 'ARM64'
+}
+
 class HardwareDetector:
     """Comprehensive hardware detection and identification system"""
     
@@ -131,7 +147,57 @@ class HardwareDetector:
         return cpu_info
     
     async def _detect_windows_cpu(self) -> Dict[str, Any]:
-        """Windows-specific CPU detection using WMI"""
+        """Windows-specific CPU detection using GetSystemInfo and the registry"""
+        if os.environ.get('MD_USE_WMI'):
+            return await self._detect_windows_cpu_wmi()
+        
+        cpu_info = {}
+        try:
+            import ctypes
+            from ctypes import wintypes
+            import psutil
+            
+            class SYSTEM_INFO(ctypes.Structure):
+                _fields_ = [
+                    ('wProcessorArchitecture', wintypes.WORD),
+                    ('wReserved', wintypes.WORD),
+                    ('dwPageSize', wintypes.DWORD),
+                    ('lpMinimumApplicationAddress', wintypes.LPVOID),
+                    ('lpMaximumApplicationAddress', wintypes.LPVOID),
+                    ('dwActiveProcessorMask', ctypes.c_size_t),
+                    ('dwNumberOfProcessors', wintypes.DWORD),
+                    ('dwProcessorType', wintypes.DWORD),
+                    ('dwAllocationGranularity', wintypes.DWORD),
+                    ('wProcessorLevel', wintypes.WORD),
+                    ('wProcessorRevision', wintypes.WORD)
+                ]
+            
+            system_info = SYSTEM_INFO()
+            ctypes.windll.kernel32.GetSystemInfo(ctypes.byref(system_info))
+            
+            cpu_info.update({
+                'architecture': WINDOWS_PROCESSOR_ARCHITECTURES.get(system_info.wProcessorArchitecture, 'Unknown'),
+                'cores_physical': psutil.cpu_count(logical=False),
+                'cores_logical': system_info.dwNumberOfProcessors
+            })
+            
+            processor = self._read_windows_registry(
+                r'HARDWARE\DESCRIPTION\System\CentralProcessor\0',
+                ['ProcessorNameString', 'VendorIdentifier', '~MHz']
+            )
+            cpu_info.update({
+                'manufacturer': processor.get('VendorIdentifier', 'Unknown'),
+                'max_clock_speed': processor.get('~MHz', 0),
+                'model_name': processor.get('ProcessorNameString', 'Unknown').strip()
+            })
+            
+        except Exception as e:
+            self.logger.debug(f"Error detecting Windows CPU: {e}")
+        
+        return cpu_info
+    
+    async def _detect_windows_cpu_wmi(self) -> Dict[str, Any]:
+        """Windows-specific CPU detection using WMI (deep inventory mode)"""
         cpu_info = {}
         try:
             result = subprocess.run([
@@ -415,7 +481,7 @@ class HardwareDetector:
                 except:
                     pass
                     
-            elif self.system == 'windows':
+            elif self.system == 'windows' and os.environ.get('MD_USE_WMI'):
                 try:
                     result = subprocess.run([
                         'wmic', 'baseboard', 'get', 'Manufacturer,Product,Version', '/format:csv'
@@ -425,6 +491,20 @@ class HardwareDetector:
                         motherboard_info = self._parse_wmic_baseboard(result.stdout)
                 except:
                     pass
+            
+            elif self.system == 'windows' and WINREG_AVAILABLE:
+                try:
+                    bios = self._read_windows_registry(
+                        r'HARDWARE\DESCRIPTION\System\BIOS',
+                        ['BaseBoardManufacturer', 'BaseBoardProduct', 'BaseBoardVersion']
+                    )
+                    motherboard_info = {
+                        'manufacturer': bios.get('BaseBoardManufacturer', 'Unknown'),
+                        'product': bios.get('BaseBoardProduct', 'Unknown'),
+                        'version': bios.get('BaseBoardVersion', 'Unknown')
+                    }
+                except OSError:
+                    pass
                     
         except Exception as e:
             self.logger.debug(f"Error detecting motherboard: {e}")
@@ -445,7 +525,6 @@ class HardwareDetector:
                 # Check for various accelerator devices
                 accel_paths = ['/dev/accel*', '/dev/intel-fpga*', '/dev/xdma*']
                 for path_pattern in accel_paths:
-                    import glob
                     devices = glob.glob(path_pattern)
                     for device in devices:
                         accelerators['other'].append({
@@ -510,11 +589,13 @@ class HardwareDetector:
         try:
             if self.system == 'linux':
                 # Check for virtualization
-                if os.path.exists('/proc/cpuinfo'):
+                try:
                     with open('/proc/cpuinfo', 'r') as f:
                         content = f.read()
                         if 'vmx' in content or 'svm' in content:
                             capabilities['virtualization'] = True
+                except FileNotFoundError:
+                    pass
                 
                 # Check for containers
                 capabilities['containers'] = (
@@ -548,6 +629,17 @@ class HardwareDetector:
         
         return modules
     
+    def _read_windows_registry(self, key_path: str, value_names: List[str]) -> Dict[str, Any]:
+        """Read named values from a HKEY_LOCAL_MACHINE registry key"""
+        values = {}
+        with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, key_path) as key:
+            for name in value_names:
+                try:
+                    values[name] = winreg.QueryValueEx(key, name)[0]
+                except OSError:
+                    continue
+        return values
+    
     def _get_compute_capability(self, handle) -> str:
         """Get NVIDIA GPU compute capability"""
         try:
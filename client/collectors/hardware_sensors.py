@@ -8,6 +8,7 @@ import platform
 import subprocess
 import json
 import logging
+import threading
 from typing import Dict, Any, Optional, List
 import os
 
@@ -26,6 +27,12 @@ class HardwareSensorsCollector:
         self.nvidia_initialized = False
         self.sensors_available = self._check_sensors_availability()
         
+        # GPU handles and names don't change while the agent runs; enumerate them once
+        self._gpu_devices = self._enumerate_gpus() if self.nvidia_initialized else []
+        
+        # WMI connections are COM objects bound to the thread that opened them, so keep one per worker thread
+        self._wmi_local = threading.local()
+        
     def _check_sensors_availability(self) -> Dict[str, bool]:
         """Check what sensor tools are available"""
         availability = {
@@ -72,36 +79,69 @@ class HardwareSensorsCollector:
         
         return availability
     
+    def _enumerate_gpus(self) -> List[tuple]:
+        """Get (index, handle, name) for each NVIDIA device"""
+        devices = []
+        try:
+            for i in range(pynvml.nvmlDeviceGetCount()):
+                handle = pynvml.nvmlDeviceGetHandleByIndex(i)
+                devices.append((i, handle, pynvml.nvmlDeviceGetName(handle).decode()))
+        except Exception as e:
+            self.logger.debug(f"Cannot enumerate NVIDIA GPUs: {e}")
+        return devices
+    
+    def _get_wmi_connection(self):
+        """Get this thread's WMI connection to root\\wmi, opening it on first use"""
+        connection = getattr(self._wmi_local, 'connection', None)
+        if connection is None:
+            import pythoncom
+            import wmi
+            pythoncom.CoInitialize()
+            connection = wmi.WMI(namespace="root\\wmi")
+            self._wmi_local.connection = connection
+        return connection
+    
     async def collect(self) -> Dict[str, Any]:
         """Collect all available hardware sensor data"""
         try:
+            timestamp = asyncio.get_event_loop().time()
+            
+            # Sensor reads shell out or call into vendor libraries; keep them off the event loop
+            temperature, fan_speeds, voltages, gpu, power = await asyncio.gather(
+                asyncio.to_thread(self._collect_temperature),
+                asyncio.to_thread(self._collect_fan_speeds),
+                asyncio.to_thread(self._collect_voltages),
+                asyncio.to_thread(self._collect_gpu_sensors),
+                asyncio.to_thread(self._collect_power_info)
+            )
+            
             sensors_data = {
-                'timestamp': asyncio.get_event_loop().time(),
-                'temperature': await self._collect_temperature(),
-                'fan_speeds': await self._collect_fan_speeds(),
-                'voltages': await self._collect_voltages(),
-                'gpu': await self._collect_gpu_sensors(),
-                'power': await self._collect_power_info()
+                'timestamp': timestamp,
+                'temperature': temperature,
+                'fan_speeds': fan_speeds,
+                'voltages': voltages,
+                'gpu': gpu,
+                'power': power
             }
             return sensors_data
         except Exception as e:
             self.logger.error(f"Error collecting hardware sensors: {e}")
             return {'error': str(e)}
     
-    async def _collect_temperature(self) -> Dict[str, Any]:
+    def _collect_temperature(self) -> Dict[str, Any]:
         """Collect temperature sensors"""
         temperatures = {}
         
         if self.system == 'linux' and self.sensors_available['lm_sensors']:
-            temperatures.update(await self._collect_linux_temperatures())
+            temperatures.update(self._collect_linux_temperatures())
         elif self.system == 'windows' and self.sensors_available['wmi']:
-            temperatures.update(await self._collect_windows_temperatures())
+            temperatures.update(self._collect_windows_temperatures())
         elif self.system == 'darwin' and self.sensors_available['smc']:
-            temperatures.update(await self._collect_macos_temperatures())
+            temperatures.update(self._collect_macos_temperatures())
         
         return temperatures
     
-    async def _collect_linux_temperatures(self) -> Dict[str, Any]:
+    def _collect_linux_temperatures(self) -> Dict[str, Any]:
         """Collect temperatures on Linux using lm-sensors"""
         temps = {}
         try:
@@ -124,12 +164,11 @@ class HardwareSensorsCollector:
         
         return temps
     
-    async def _collect_windows_temperatures(self) -> Dict[str, Any]:
+    def _collect_windows_temperatures(self) -> Dict[str, Any]:
         """Collect temperatures on Windows using WMI"""
         temps = {}
         try:
-            import wmi
-            c = wmi.WMI(namespace="root\\wmi")
+            c = self._get_wmi_connection()
             
             # Try different WMI classes for temperature
             temp_classes = [
@@ -156,7 +195,7 @@ class HardwareSensorsCollector:
         
         return temps
     
-    async def _collect_macos_temperatures(self) -> Dict[str, Any]:
+    def _collect_macos_temperatures(self) -> Dict[str, Any]:
         """Collect temperatures on macOS using powermetrics"""
         temps = {}
         try:
@@ -181,7 +220,7 @@ class HardwareSensorsCollector:
         
         return temps
     
-    async def _collect_fan_speeds(self) -> Dict[str, Any]:
+    def _collect_fan_speeds(self) -> Dict[str, Any]:
         """Collect fan speed data"""
         fans = {}
         
@@ -206,7 +245,7 @@ class HardwareSensorsCollector:
         
         return fans
     
-    async def _collect_voltages(self) -> Dict[str, Any]:
+    def _collect_voltages(self) -> Dict[str, Any]:
         """Collect voltage data"""
         voltages = {}
         
@@ -231,18 +270,13 @@ class HardwareSensorsCollector:
         
         return voltages
     
-    async def _collect_gpu_sensors(self) -> Dict[str, Any]:
+    def _collect_gpu_sensors(self) -> Dict[str, Any]:
         """Collect GPU sensor data"""
         gpu_data = {}
         
         if self.nvidia_initialized:
             try:
-                device_count = pynvml.nvmlDeviceGetCount()
-                
-                for i in range(device_count):
-                    handle = pynvml.nvmlDeviceGetHandleByIndex(i)
-                    name = pynvml.nvmlDeviceGetName(handle).decode()
-                    
+                for i, handle, name in self._gpu_devices:
                     gpu_info = {
                         'name': name,
                         'index': i
@@ -288,7 +322,7 @@ class HardwareSensorsCollector:
         
         return gpu_data
     
-    async def _collect_power_info(self) -> Dict[str, Any]:
+    def _collect_power_info(self) -> Dict[str, Any]:
         """Collect power consumption information"""
         power_data = {}
         
@@ -305,20 +339,19 @@ class HardwareSensorsCollector:
                             # Read battery files
                             for file_name in ['capacity', 'status', 'voltage_now', 'current_now']:
                                 file_path = os.path.join(battery_dir, file_name)
-                                if os.path.exists(file_path):
-                                    try:
-                                        with open(file_path, 'r') as f:
-                                            value = f.read().strip()
-                                            if file_name == 'capacity':
-                                                battery_info['capacity_percent'] = int(value)
-                                            elif file_name == 'status':
-                                                battery_info['status'] = value
-                                            elif file_name == 'voltage_now':
-                                                battery_info['voltage'] = int(value) / 1000000  # Convert to volts
-                                            elif file_name == 'current_now':
-                                                battery_info['current'] = int(value) / 1000000  # Convert to amps
-                                    except:
-                                        pass
+                                try:
+                                    with open(file_path, 'r') as f:
+                                        value = f.read().strip()
+                                        if file_name == 'capacity':
+                                            battery_info['capacity_percent'] = int(value)
+                                        elif file_name == 'status':
+                                            battery_info['status'] = value
+                                        elif file_name == 'voltage_now':
+                                            battery_info['voltage'] = int(value) / 1000000  # Convert to volts
+                                        elif file_name == 'current_now':
+                                            battery_info['current'] = int(value) / 1000000  # Convert to amps
+                                except:
+                                    pass
                             
                             if battery_info:
                                 power_data[battery] = battery_info
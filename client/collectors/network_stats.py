@@ -5,12 +5,21 @@ Collects comprehensive network interface statistics and connection information
 import asyncio
 import psutil
 import socket
+import subprocess
 import time
 import logging
+from collections import Counter
 from typing import Dict, Any, List
 import netifaces
 import platform
 
+_CONNECTION_KINDS = {
+    (socket.AF_INET, socket.SOCK_STREAM): 'tcp',
+    (socket.AF_INET, socket.SOCK_DGRAM): 'udp',
+    (socket.AF_INET6, socket.SOCK_STREAM): 'tcp6',
+    (socket.AF_INET6, socket.SOCK_DGRAM): 'udp6'
+}
+
 class NetworkStatsCollector:
     """Collects network statistics and interface information"""
     
@@ -20,16 +29,28 @@ class NetworkStatsCollector:
         self._previous_stats = {}
         self._last_collection_time = 0
         
+        # Interface addresses change on DHCP/VPN events, not every collection
+        self._interface_cache = None
+        self._interface_cache_ts = 0.0
+        self._interface_cache_ttl = 60.0
+        
     async def collect(self) -> Dict[str, Any]:
         """Collect all network statistics"""
         try:
             current_time = time.time()
+            interfaces, connections, routing, dns = await asyncio.gather(
+                asyncio.to_thread(self._collect_interface_stats),
+                asyncio.to_thread(self._collect_connections),
+                asyncio.to_thread(self._collect_routing_info),
+                asyncio.to_thread(self._collect_dns_info)
+            )
+            
             stats = {
                 'timestamp': current_time,
-                'interfaces': await self._collect_interface_stats(),
-                'connections': await self._collect_connections(),
-                'routing': await self._collect_routing_info(),
-                'dns': await self._collect_dns_info()
+                'interfaces': interfaces,
+                'connections': connections,
+                'routing': routing,
+                'dns': dns
             }
             
             # Calculate rates if we have previous data
@@ -45,7 +66,7 @@ class NetworkStatsCollector:
             self.logger.error(f"Error collecting network stats: {e}")
             return {'error': str(e)}
     
-    async def _collect_interface_stats(self) -> Dict[str, Any]:
+    def _collect_interface_stats(self) -> Dict[str, Any]:
         """Collect network interface statistics"""
         interfaces = {}
         
@@ -54,11 +75,20 @@ class NetworkStatsCollector:
             net_io = psutil.net_io_counters(pernic=True)
             
             # Get interface addresses
-            net_addrs = psutil.net_if_addrs()
+            net_addrs, netifaces_names = self._get_interface_info()
             
             # Get interface status
             net_stats = psutil.net_if_stats()
             
+            # Default gateway interface, looked up once rather than per interface
+            default_interface = None
+            try:
+                gws = netifaces.gateways()
+                if 'default' in gws and netifaces.AF_INET in gws['default']:
+                    default_interface = gws['default'][netifaces.AF_INET][1]
+            except Exception:
+                pass
+            
             for interface, io_stats in net_io.items():
                 interface_info = {
                     'io_stats': {
@@ -99,15 +129,8 @@ class NetworkStatsCollector:
                     }
                 
                 # Add additional interface details using netifaces
-                try:
-                    if interface in netifaces.interfaces():
-                        gws = netifaces.gateways()
-                        if 'default' in gws and netifaces.AF_INET in gws['default']:
-                            default_gw = gws['default'][netifaces.AF_INET]
-                            if default_gw[1] == interface:
-                                interface_info['is_default'] = True
-                except Exception:
-                    pass
+                if interface in netifaces_names and interface == default_interface:
+                    interface_info['is_default'] = True
                 
                 interfaces[interface] = interface_info
                 
@@ -116,7 +139,19 @@ class NetworkStatsCollector:
         
         return interfaces
     
-    async def _collect_connections(self) -> Dict[str, Any]:
+    def _get_interface_info(self):
+        """Get interface addresses and netifaces names, refreshing them once older than the TTL"""
+        now = time.monotonic()
+        if self._interface_cache is None or now - self._interface_cache_ts > self._interface_cache_ttl:
+            try:
+                names = set(netifaces.interfaces())
+            except Exception:
+                names = set()
+            self._interface_cache = (psutil.net_if_addrs(), names)
+            self._interface_cache_ts = now
+        return self._interface_cache
+    
+    def _collect_connections(self) -> Dict[str, Any]:
         """Collect network connections"""
         connections = {
             'tcp': [],
@@ -131,46 +166,48 @@ class NetworkStatsCollector:
         }
         
         try:
-            # Get all network connections
-            for kind in ['tcp', 'udp', 'tcp6', 'udp6']:
-                try:
-                    conns = psutil.net_connections(kind=kind)
-                    for conn in conns:
-                        conn_info = {
-                            'fd': conn.fd,
-                            'family': str(conn.family),
-                            'type': str(conn.type),
-                            'local': f"{conn.laddr.ip}:{conn.laddr.port}" if conn.laddr else None,
-                            'remote': f"{conn.raddr.ip}:{conn.raddr.port}" if conn.raddr else None,
-                            'status': conn.status,
-                            'pid': conn.pid
-                        }
-                        
-                        # Get process name if available
-                        if conn.pid:
-                            try:
-                                process = psutil.Process(conn.pid)
-                                conn_info['process_name'] = process.name()
-                            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                                pass
-                        
-                        connections[kind].append(conn_info)
-                        connections['stats']['total'] += 1
-                        
-                        if conn.status == 'ESTABLISHED':
-                            connections['stats']['established'] += 1
-                        elif conn.status == 'LISTEN':
-                            connections['stats']['listening'] += 1
-                            
-                except Exception as e:
-                    self.logger.debug(f"Error collecting {kind} connections: {e}")
+            # One walk of the socket tables covers all four kinds; per-kind calls would repeat it
+            states = Counter()
+            process_names = {}
+            for conn in psutil.net_connections(kind='inet'):
+                kind = _CONNECTION_KINDS.get((conn.family, conn.type))
+                if kind is None:
+                    continue
+                
+                conn_info = {
+                    'fd': conn.fd,
+                    'family': str(conn.family),
+                    'type': str(conn.type),
+                    'local': f"{conn.laddr.ip}:{conn.laddr.port}" if conn.laddr else None,
+                    'remote': f"{conn.raddr.ip}:{conn.raddr.port}" if conn.raddr else None,
+                    'status': conn.status,
+                    'pid': conn.pid
+                }
+                
+                # Get process name if available, once per PID
+                if conn.pid:
+                    if conn.pid not in process_names:
+                        try:
+                            process_names[conn.pid] = psutil.Process(conn.pid).name()
+                        except (psutil.NoSuchProcess, psutil.AccessDenied):
+                            process_names[conn.pid] = None
+                    if process_names[conn.pid]:
+                        conn_info['process_name'] = process_names[conn.pid]
+                
+                connections[kind].append(conn_info)
+                states[conn.status] += 1
+            
+            connections['stats']['total'] = sum(states.values())
+            connections['stats']['established'] = states[psutil.CONN_ESTABLISHED]
+            connections['stats']['listening'] = states[psutil.CONN_LISTEN]
+            connections['stats']['states'] = dict(states)
                     
         except Exception as e:
             self.logger.debug(f"Error collecting connections: {e}")
         
         return connections
     
-    async def _collect_routing_info(self) -> Dict[str, Any]:
+    def _collect_routing_info(self) -> Dict[str, Any]:
         """Collect routing table information"""
         routing = {
             'default_gateway': None,
@@ -206,7 +243,7 @@ class NetworkStatsCollector:
         
         return routing
     
-    async def _collect_dns_info(self) -> Dict[str, Any]:
+    def _collect_dns_info(self) -> Dict[str, Any]:
         """Collect DNS configuration"""
         dns_info = {
             'nameservers': [],
@@ -232,7 +269,6 @@ class NetworkStatsCollector:
             elif self.system == 'windows':
                 # Use subprocess to get DNS servers
                 try:
-                    import subprocess
                     result = subprocess.run([
                         'netsh', 'interface', 'ip', 'show', 'dns'
                     ], capture_output=True, text=True)
@@ -247,7 +283,6 @@ class NetworkStatsCollector:
             elif self.system == 'darwin':
                 # Use scutil on macOS
                 try:
-                    import subprocess
                     result = subprocess.run([
                         'scutil', '--dns'
                     ], capture_output=True, text=True)
@@ -3,9 +3,11 @@ Process monitor for Master Dashboard Agent
 Tracks system processes with detailed resource consumption including CPU, memory, GPU, disk I/O, and network usage
 """
 import asyncio
+import heapq
 import psutil
 import time
 import logging
+from operator import itemgetter
 from typing import Dict, Any, List, Optional
 import platform
 import subprocess
@@ -17,6 +19,12 @@ try:
 except ImportError:
     NVIDIA_AVAILABLE = False
 
+_cpu_key = itemgetter('cpu_percent')
+_memory_key = itemgetter('memory_percent')
+_disk_io_key = itemgetter('total_io')
+_connections_key = itemgetter('connections_count')
+_gpu_memory_key = itemgetter('gpu_memory_used')
+
 class ProcessMonitor:
     """Monitors system processes with detailed resource tracking"""
     
@@ -26,12 +34,16 @@ class ProcessMonitor:
         self.nvidia_initialized = False
         self._previous_stats = {}
         self._last_collection_time = 0
+        self._gpu_handles = []
         
         # Initialize NVIDIA if available
         if NVIDIA_AVAILABLE:
             try:
                 pynvml.nvmlInit()
                 self.nvidia_initialized = True
+                self._gpu_handles = [
+                    pynvml.nvmlDeviceGetHandleByIndex(i) for i in range(pynvml.nvmlDeviceGetCount())
+                ]
             except Exception as e:
                 self.logger.debug(f"NVIDIA ML not available: {e}")
     
@@ -40,19 +52,9 @@ class ProcessMonitor:
         try:
             current_time = time.time()
             
-            processes_data = {
-                'timestamp': current_time,
-                'processes': await self._collect_process_list(),
-                'top_cpu': await self._get_top_processes_by_cpu(),
-                'top_memory': await self._get_top_processes_by_memory(),
-                'top_disk_io': await self._get_top_processes_by_disk_io(),
-                'top_network': await self._get_top_processes_by_network(),
-                'summary': await self._get_process_summary()
-            }
-            
-            # Add GPU processes if available
-            if self.nvidia_initialized:
-                processes_data['top_gpu'] = await self._get_top_processes_by_gpu()
+            # Walking the process table is blocking work; run it on a worker thread
+            processes_data = await asyncio.to_thread(self._collect_snapshot)
+            processes_data['timestamp'] = current_time
             
             # Calculate rates if we have previous data
             if self._previous_stats and self._last_collection_time:
@@ -68,11 +70,30 @@ class ProcessMonitor:
             self.logger.error(f"Error collecting process data: {e}")
             return {'error': str(e)}
     
-    async def _collect_process_list(self) -> List[Dict[str, Any]]:
+    def _collect_snapshot(self) -> Dict[str, Any]:
+        """Collect every process view from a single walk of the process table"""
+        processes = self._collect_process_list()
+        snapshot = {
+            'processes': processes,
+            'top_cpu': self._get_top_processes_by_cpu(processes),
+            'top_memory': self._get_top_processes_by_memory(processes),
+            'top_disk_io': self._get_top_processes_by_disk_io(processes),
+            'top_network': self._get_top_processes_by_network(processes),
+            'summary': self._get_process_summary(processes)
+        }
+        
+        # Add GPU processes if available
+        if self.nvidia_initialized:
+            snapshot['top_gpu'] = self._get_top_processes_by_gpu()
+        
+        return snapshot
+    
+    def _collect_process_list(self) -> List[Dict[str, Any]]:
         """Collect detailed information for all processes"""
         processes = []
         
         try:
+            now = time.time()
             for proc in psutil.process_iter([
                 'pid', 'name', 'username', 'status', 'create_time',
                 'cpu_percent', 'memory_percent', 'memory_info',
@@ -82,7 +103,7 @@ class ProcessMonitor:
                     proc_info = proc.info.copy()
                     
                     # Add additional information
-                    proc_info['runtime'] = time.time() - proc_info['create_time']
+                    proc_info['runtime'] = now - proc_info['create_time'] if proc_info['create_time'] else None
                     proc_info['memory_rss'] = proc_info['memory_info'].rss if proc_info['memory_info'] else 0
                     proc_info['memory_vms'] = proc_info['memory_info'].vms if proc_info['memory_info'] else 0
                     
@@ -151,106 +172,72 @@ class ProcessMonitor:
         
         return processes
     
-    async def _get_top_processes_by_cpu(self, limit: int = 10) -> List[Dict[str, Any]]:
+    def _get_top_processes_by_cpu(self, processes: List[Dict[str, Any]], limit: int = 10) -> List[Dict[str, Any]]:
         """Get top processes by CPU usage"""
-        try:
-            processes = []
-            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'username']):
-                try:
-                    cpu_percent = proc.cpu_percent()
-                    if cpu_percent > 0:
-                        processes.append({
-                            'pid': proc.pid,
-                            'name': proc.name(),
-                            'cpu_percent': cpu_percent,
-                            'username': proc.username()
-                        })
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
-            
-            return sorted(processes, key=lambda x: x['cpu_percent'], reverse=True)[:limit]
-        except Exception as e:
-            self.logger.debug(f"Error getting top CPU processes: {e}")
-            return []
+        return heapq.nlargest(limit, (
+            {
+                'pid': proc['pid'],
+                'name': proc['name'],
+                'cpu_percent': proc['cpu_percent'],
+                'username': proc['username']
+            }
+            for proc in processes if proc['cpu_percent']
+        ), key=_cpu_key)
     
-    async def _get_top_processes_by_memory(self, limit: int = 10) -> List[Dict[str, Any]]:
+    def _get_top_processes_by_memory(self, processes: List[Dict[str, Any]], limit: int = 10) -> List[Dict[str, Any]]:
         """Get top processes by memory usage"""
-        try:
-            processes = []
-            for proc in psutil.process_iter(['pid', 'name', 'memory_percent', 'memory_info', 'username']):
-                try:
-                    memory_info = proc.memory_info()
-                    processes.append({
-                        'pid': proc.pid,
-                        'name': proc.name(),
-                        'memory_percent': proc.memory_percent(),
-                        'memory_rss': memory_info.rss,
-                        'memory_vms': memory_info.vms,
-                        'username': proc.username()
-                    })
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
-            
-            return sorted(processes, key=lambda x: x['memory_percent'], reverse=True)[:limit]
-        except Exception as e:
-            self.logger.debug(f"Error getting top memory processes: {e}")
-            return []
+        return heapq.nlargest(limit, (
+            {
+                'pid': proc['pid'],
+                'name': proc['name'],
+                'memory_percent': proc['memory_percent'] or 0,
+                'memory_rss': proc['memory_rss'],
+                'memory_vms': proc['memory_vms'],
+                'username': proc['username']
+            }
+            for proc in processes if proc['memory_info'] is not None
+        ), key=_memory_key)
     
-    async def _get_top_processes_by_disk_io(self, limit: int = 10) -> List[Dict[str, Any]]:
+    def _get_top_processes_by_disk_io(self, processes: List[Dict[str, Any]], limit: int = 10) -> List[Dict[str, Any]]:
         """Get top processes by disk I/O"""
-        try:
-            processes = []
-            for proc in psutil.process_iter(['pid', 'name', 'username']):
-                try:
-                    io_counters = proc.io_counters()
-                    total_io = io_counters.read_bytes + io_counters.write_bytes
-                    if total_io > 0:
-                        processes.append({
-                            'pid': proc.pid,
-                            'name': proc.name(),
-                            'read_bytes': io_counters.read_bytes,
-                            'write_bytes': io_counters.write_bytes,
-                            'total_io': total_io,
-                            'username': proc.username()
-                        })
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
-            
-            return sorted(processes, key=lambda x: x['total_io'], reverse=True)[:limit]
-        except Exception as e:
-            self.logger.debug(f"Error getting top disk I/O processes: {e}")
-            return []
+        candidates = []
+        for proc in processes:
+            io = proc['io']
+            if not io:
+                continue
+            total_io = io['read_bytes'] + io['write_bytes']
+            if total_io > 0:
+                candidates.append({
+                    'pid': proc['pid'],
+                    'name': proc['name'],
+                    'read_bytes': io['read_bytes'],
+                    'write_bytes': io['write_bytes'],
+                    'total_io': total_io,
+                    'username': proc['username']
+                })
+        
+        return heapq.nlargest(limit, candidates, key=_disk_io_key)
     
-    async def _get_top_processes_by_network(self, limit: int = 10) -> List[Dict[str, Any]]:
+    def _get_top_processes_by_network(self, processes: List[Dict[str, Any]], limit: int = 10) -> List[Dict[str, Any]]:
         """Get top processes by network connections"""
-        try:
-            processes = []
-            for proc in psutil.process_iter(['pid', 'name', 'username']):
-                try:
-                    connections = proc.connections()
-                    if connections:
-                        processes.append({
-                            'pid': proc.pid,
-                            'name': proc.name(),
-                            'connections_count': len(connections),
-                            'username': proc.username(),
-                            'connections': [
-                                {
-                                    'local': f"{conn.laddr.ip}:{conn.laddr.port}" if conn.laddr else None,
-                                    'remote': f"{conn.raddr.ip}:{conn.raddr.port}" if conn.raddr else None,
-                                    'status': conn.status
-                                } for conn in connections[:3]  # Show first 3 connections
-                            ]
-                        })
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
-            
-            return sorted(processes, key=lambda x: x['connections_count'], reverse=True)[:limit]
-        except Exception as e:
-            self.logger.debug(f"Error getting top network processes: {e}")
-            return []
+        return heapq.nlargest(limit, (
+            {
+                'pid': proc['pid'],
+                'name': proc['name'],
+                'connections_count': proc['connections'],
+                'username': proc['username'],
+                'connections': [
+                    {
+                        'local': conn['local'],
+                        'remote': conn['remote'],
+                        'status': conn['status']
+                    } for conn in proc['network_connections'][:3]  # Show first 3 connections
+                ]
+            }
+            for proc in processes if proc['connections']
+        ), key=_connections_key)
     
-    async def _get_top_processes_by_gpu(self, limit: int = 10) -> List[Dict[str, Any]]:
+    def _get_top_processes_by_gpu(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get top processes by GPU usage (NVIDIA only)"""
         try:
             gpu_processes = []
@@ -258,11 +245,7 @@ class ProcessMonitor:
             if not self.nvidia_initialized:
                 return gpu_processes
             
-            device_count = pynvml.nvmlDeviceGetCount()
-            
-            for gpu_id in range(device_count):
-                handle = pynvml.nvmlDeviceGetHandleByIndex(gpu_id)
-                
+            for gpu_id, handle in enumerate(self._gpu_handles):
                 try:
                     processes = pynvml.nvmlDeviceGetComputeRunningProcesses(handle)
                     
@@ -284,49 +267,38 @@ class ProcessMonitor:
                 except pynvml.NVMLError:
                     continue
             
-            return sorted(gpu_processes, key=lambda x: x['gpu_memory_used'], reverse=True)[:limit]
+            return heapq.nlargest(limit, gpu_processes, key=_gpu_memory_key)
             
         except Exception as e:
             self.logger.debug(f"Error getting GPU processes: {e}")
             return []
     
-    async def _get_process_summary(self) -> Dict[str, Any]:
+    def _get_process_summary(self, processes: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Get summary statistics about processes"""
-        try:
-            total_processes = 0
-            running_processes = 0
-            sleeping_processes = 0
-            zombie_processes = 0
-            total_threads = 0
-            
-            for proc in psutil.process_iter(['status', 'num_threads']):
-                try:
-                    total_processes += 1
-                    status = proc.status()
-                    
-                    if status == psutil.STATUS_RUNNING:
-                        running_processes += 1
-                    elif status == psutil.STATUS_SLEEPING:
-                        sleeping_processes += 1
-                    elif status == psutil.STATUS_ZOMBIE:
-                        zombie_processes += 1
-                    
-                    total_threads += proc.num_threads()
-                    
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
+        running_processes = 0
+        sleeping_processes = 0
+        zombie_processes = 0
+        total_threads = 0
+        
+        for proc in processes:
+            status = proc['status']
             
-            return {
-                'total_processes': total_processes,
-                'running_processes': running_processes,
-                'sleeping_processes': sleeping_processes,
-                'zombie_processes': zombie_processes,
-                'total_threads': total_threads
-            }
+            if status == psutil.STATUS_RUNNING:
+                running_processes += 1
+            elif status == psutil.STATUS_SLEEPING:
+                sleeping_processes += 1
+            elif status == psutil.STATUS_ZOMBIE:
+                zombie_processes += 1
             
-        except Exception as e:
-            self.logger.debug(f"Error getting process summary: {e}")
-            return {}
+            total_threads += proc['num_threads'] or 0
+        
+        return {
+            'total_processes': len(processes),
+            'running_processes': running_processes,
+            'sleeping_processes': sleeping_processes,
+            'zombie_processes': zombie_processes,
+            'total_threads': total_threads
+        }
     
     def _calculate_process_rates(self, current_data: Dict, time_delta: float) -> Dict[str, Any]:
         """Calculate process resource usage rates"""
@@ -21,27 +21,65 @@ class SystemMetricsCollector:
         self._cpu_count = psutil.cpu_count()
         self._cpu_count_logical = psutil.cpu_count(logical=True)
         
+        # Mounted partitions rarely change; re-read them at most once per TTL
+        self._disk_partitions = None
+        self._disk_partitions_ts = 0.0
+        self._disk_partitions_ttl = 60.0
+        
+        # A hung network mount must not stall the collection; skip it until its pending call returns
+        self._disk_usage_timeout = 2.0
+        self._stalled_mounts = set()
+        
+        # Prime the non-blocking cpu_percent() calls; each later call reports usage since the previous one
+        psutil.cpu_percent(interval=None)
+        psutil.cpu_percent(interval=None, percpu=True)
+        
+        # Caps how many psutil calls run on worker threads at once, disk fan-out included
+        self._max_concurrent = 2
+        self._collect_sem = None
+        
     async def collect(self) -> Dict[str, Any]:
         """Collect all system metrics"""
         try:
+            timestamp = time.time()
+            
+            # psutil calls block, so each category runs on a worker thread and they overlap
+            cpu, memory, disk, system = await asyncio.gather(
+                self._run_blocking(self._collect_cpu_metrics),
+                self._run_blocking(self._collect_memory_metrics),
+                self._collect_disk_metrics(),
+                self._run_blocking(self._collect_system_info)
+            )
+            
             metrics = {
-                'timestamp': time.time(),
-                'cpu': await self._collect_cpu_metrics(),
-                'memory': await self._collect_memory_metrics(),
-                'disk': await self._collect_disk_metrics(),
-                'system': await self._collect_system_info(),
-                'uptime': time.time() - self.boot_time
+                'timestamp': timestamp,
+                'cpu': cpu,
+                'memory': memory,
+                'disk': disk,
+                'system': system,
+                'uptime': timestamp - self.boot_time
             }
             return metrics
         except Exception as e:
             self.logger.error(f"Error collecting system metrics: {e}")
             return {'error': str(e)}
     
-    async def _collect_cpu_metrics(self) -> Dict[str, Any]:
+    async def _run_blocking(self, func):
+        """Run a blocking collection step on a worker thread, bounded by the collector's semaphore"""
+        async with self._semaphore():
+            return await asyncio.to_thread(func)
+    
+    def _semaphore(self) -> asyncio.Semaphore:
+        """Get the semaphore shared by every threaded psutil call"""
+        if self._collect_sem is None:
+            self._collect_sem = asyncio.Semaphore(self._max_concurrent)
+        return self._collect_sem
+    
+    def _collect_cpu_metrics(self) -> Dict[str, Any]:
         """Collect CPU metrics"""
-        # Get CPU usage over 1 second interval for accuracy
-        cpu_percent = psutil.cpu_percent(interval=1)
-        cpu_per_core = psutil.cpu_percent(interval=1, percpu=True)
+        # CPU usage since the previous collection, without sleeping on the event loop
+        cpu_percent = psutil.cpu_percent(interval=None)
+        cpu_per_core = psutil.cpu_percent(interval=None, percpu=True)
         
         # CPU frequency
         cpu_freq = psutil.cpu_freq()
@@ -77,7 +115,7 @@ class SystemMetricsCollector:
             }
         }
     
-    async def _collect_memory_metrics(self) -> Dict[str, Any]:
+    def _collect_memory_metrics(self) -> Dict[str, Any]:
         """Collect memory metrics"""
         # Virtual memory
         virtual_mem = psutil.virtual_memory()
@@ -109,25 +147,60 @@ class SystemMetricsCollector:
     async def _collect_disk_metrics(self) -> Dict[str, Any]:
         """Collect disk metrics"""
         disk_usage = {}
-        disk_io = {}
         
-        # Disk usage for each partition
-        partitions = psutil.disk_partitions()
-        for partition in partitions:
+        # Disk usage for each partition, queried concurrently so the slowest mount bounds the wait
+        partitions = [
+            p for p in await self._run_blocking(self._get_disk_partitions)
+            if p.mountpoint not in self._stalled_mounts
+        ]
+        usages = await asyncio.gather(
+            *(self._get_disk_usage(partition.mountpoint) for partition in partitions),
+            return_exceptions=True
+        )
+        for partition, usage in zip(partitions, usages):
+            if isinstance(usage, asyncio.TimeoutError):
+                self.logger.warning(f"Timed out reading disk usage for {partition.mountpoint}")
+                continue
+            if isinstance(usage, Exception):
+                self.logger.debug(f"Cannot access disk {partition.device}: {usage}")
+                continue
+            disk_usage[partition.device] = {
+                'mountpoint': partition.mountpoint,
+                'fstype': partition.fstype,
+                'total': usage.total,
+                'used': usage.used,
+                'free': usage.free,
+                'percent': (usage.used / usage.total) * 100 if usage.total > 0 else 0
+            }
+        
+        return {
+            'usage': disk_usage,
+            'io': await self._run_blocking(self._collect_disk_io)
+        }
+    
+    async def _get_disk_usage(self, mountpoint: str):
+        """Read usage for one mountpoint on a worker thread, giving up after the timeout"""
+        # The slot is freed on timeout; the stalled mount is skipped instead of holding it
+        async with self._semaphore():
+            future = asyncio.get_running_loop().run_in_executor(None, psutil.disk_usage, mountpoint)
             try:
-                usage = psutil.disk_usage(partition.mountpoint)
-                disk_usage[partition.device] = {
-                    'mountpoint': partition.mountpoint,
-                    'fstype': partition.fstype,
-                    'total': usage.total,
-                    'used': usage.used,
-                    'free': usage.free,
-                    'percent': (usage.used / usage.total) * 100 if usage.total > 0 else 0
-                }
-            except (PermissionError, OSError) as e:
-                self.logger.debug(f"Cannot access disk {partition.device}: {e}")
-        
-        # Disk I/O statistics
+                return await asyncio.wait_for(asyncio.shield(future), self._disk_usage_timeout)
+            except asyncio.TimeoutError:
+                # The thread cannot be interrupted; remember the mount until the call finally returns
+                self._stalled_mounts.add(mountpoint)
+                
+                def _release(done):
+                    self._stalled_mounts.discard(mountpoint)
+                    if not done.cancelled():
+                        done.exception()  # Mark any late error as retrieved
+                
+                future.add_done_callback(_release)
+                raise
+    
+    def _collect_disk_io(self) -> Dict[str, Any]:
+        """Collect per-disk I/O counters"""
+        disk_io = {}
+        
         try:
             disk_io_counters = psutil.disk_io_counters(perdisk=True)
             if disk_io_counters:
@@ -143,12 +216,17 @@ class SystemMetricsCollector:
         except Exception as e:
             self.logger.debug(f"Cannot get disk I/O stats: {e}")
         
-        return {
-            'usage': disk_usage,
-            'io': disk_io
-        }
+        return disk_io
+    
+    def _get_disk_partitions(self) -> List[Any]:
+        """Get mounted partitions, refreshing the cached list once it is older than the TTL"""
+        now = time.monotonic()
+        if self._disk_partitions is None or now - self._disk_partitions_ts > self._disk_partitions_ttl:
+            self._disk_partitions = psutil.disk_partitions()
+            self._disk_partitions_ts = now
+        return self._disk_partitions
     
-    async def _collect_system_info(self) -> Dict[str, Any]:
+    def _collect_system_info(self) -> Dict[str, Any]:
         """Collect system information"""
         uname = platform.uname()
         
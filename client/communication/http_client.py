@@ -7,11 +7,14 @@ import asyncio
 import aiohttp
 import json
 import logging
+import random
 import time
 from typing import Dict, Any, Optional
 import ssl
 from urllib.parse import urljoin
 
+from utils.serialization import json_dumps
+
 class HTTPClient:
     """HTTP client for API communication with Master Dashboard server"""
     
@@ -23,6 +26,7 @@ class HTTPClient:
         self.timeout = aiohttp.ClientTimeout(total=30)
         self.max_retries = 3
         self.retry_delay = 1
+        self._url_cache: Dict[str, str] = {}
         
         # SSL context for secure connections
         self.ssl_context = ssl.create_default_context()
@@ -47,12 +51,14 @@ class HTTPClient:
                 limit=100,
                 limit_per_host=30,
                 ttl_dns_cache=300,
-                use_dns_cache=True
+                use_dns_cache=True,
+                keepalive_timeout=60  # Outlive the collection interval so connections are reused
             )
             
             self.session = aiohttp.ClientSession(
                 connector=connector,
                 timeout=self.timeout,
+                json_serialize=json_dumps,
                 headers={
                     'User-Agent': 'MasterDashboard-Agent/1.0',
                     'Authorization': f'Bearer {self.api_key}',
@@ -82,11 +88,24 @@ class HTTPClient:
         """Make DELETE request"""
         return await self._request('DELETE', endpoint)
     
+    def _build_url(self, endpoint: str) -> str:
+        """Resolve an endpoint against the base URL, caching the result"""
+        url = self._url_cache.get(endpoint)
+        if url is None:
+            url = urljoin(self.base_url, endpoint.lstrip('/'))
+            self._url_cache[endpoint] = url
+        return url
+    
+    async def _retry_wait(self, attempt: int):
+        """Exponential backoff with jitter so many agents don't retry in lockstep"""
+        delay = min(self.retry_delay * 2 ** attempt, 30)
+        await asyncio.sleep(delay + random.uniform(0, self.retry_delay))
+    
     async def _request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
         """Make HTTP request with retry logic"""
         await self._ensure_session()
         
-        url = urljoin(self.base_url, endpoint.lstrip('/'))
+        url = self._build_url(endpoint)
         
         for attempt in range(self.max_retries + 1):
             try:
@@ -132,7 +151,7 @@ class HTTPClient:
                         error_msg = f"Server error: {response.status}"
                         self.logger.error(error_msg)
                         if attempt < self.max_retries:
-                            await asyncio.sleep(self.retry_delay * (attempt + 1))
+                            await self._retry_wait(attempt)
                             continue
                         return {'success': False, 'error': error_msg}
                     else:
@@ -145,7 +164,7 @@ class HTTPClient:
                 self.logger.error(error_msg)
                 
                 if attempt < self.max_retries:
-                    await asyncio.sleep(self.retry_delay * (attempt + 1))
+                    await self._retry_wait(attempt)
                     continue
                     
                 return {'success': False, 'error': error_msg}
@@ -155,7 +174,7 @@ class HTTPClient:
                 self.logger.error(error_msg)
                 
                 if attempt < self.max_retries:
-                    await asyncio.sleep(self.retry_delay * (attempt + 1))
+                    await self._retry_wait(attempt)
                     continue
                     
                 return {'success': False, 'error': error_msg}
@@ -165,35 +184,46 @@ class HTTPClient:
                 self.logger.error(error_msg)
                 
                 if attempt < self.max_retries:
-                    await asyncio.sleep(self.retry_delay * (attempt + 1))
+                    await self._retry_wait(attempt)
                     continue
                     
                 return {'success': False, 'error': error_msg}
         
         return {'success': False, 'error': 'Max retries exceeded'}
     
-    async def send_metrics_batch(self, metrics_list: list) -> Dict[str, Any]:
-        """Send multiple metrics in a batch"""
-        try:
-            batch_data = {
-                'timestamp': time.time(),
-                'batch_size': len(metrics_list),
-                'metrics': metrics_list
-            }
-            
-            response = await self.post('/api/v1/metrics/batch', batch_data)
-            
-            if response.get('success', False):
-                self.logger.debug(f"Sent batch of {len(metrics_list)} metrics")
-            else:
-                self.logger.warning(f"Batch send failed: {response.get('error', 'Unknown error')}")
+    async def send_metrics_batch(self, batches: list) -> Dict[str, Any]:
+        """Send MetricsBatch payloads in order, stopping at the first one the server doesn't accept
+        
+        Returns how many were sent and, on failure, whether retrying could succeed.
+        """
+        await self._ensure_session()
+        url = self._build_url('/api/v1/metrics/batch')
+        sent = 0
+        
+        for batch in batches:
+            if not batch['metrics']:
+                sent += 1
+                continue
             
-            return response
+            try:
+                async with self.session.post(url, json=batch) as response:
+                    if response.status in (200, 201):
+                        sent += 1
+                        continue
+                    
+                    body = await response.text()
+                    error_msg = f"HTTP {response.status}: {body[:200]}"
+                    # Client errors other than timeouts/rate limits mean the payload itself is refused
+                    retryable = response.status >= 500 or response.status in (408, 429)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                error_msg = f"HTTP client error: {e!r}"
+                retryable = True
             
-        except Exception as e:
-            error_msg = f"Error sending metrics batch: {e}"
-            self.logger.error(error_msg)
-            return {'success': False, 'error': error_msg}
+            self.logger.warning(f"Batch send failed after {sent}/{len(batches)} samples: {error_msg}")
+            return {'success': False, 'sent': sent, 'retryable': retryable, 'error': error_msg}
+        
+        self.logger.debug(f"Sent batch of {sent} samples")
+        return {'success': True, 'sent': sent}
     
     async def health_check(self) -> Dict[str, Any]:
         """Check server health"""
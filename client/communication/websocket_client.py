@@ -5,20 +5,25 @@ Handles real-time communication with the Master Dashboard server via WebSocket
 import asyncio
 import json
 import logging
+import platform
+import random
 import time
 from typing import Dict, Any, Optional, Callable
 import websockets
 from websockets.exceptions import ConnectionClosed, InvalidStatusCode
 import ssl
 
+from utils.serialization import json_dumps
+
 class WebSocketClient:
     """WebSocket client for real-time communication"""
     
-    def __init__(self, url: str, machine_id: str, api_key: str, logger: logging.Logger):
+    def __init__(self, url: str, machine_id: str, api_key: str, logger: logging.Logger, compression: bool = False):
         self.url = url
         self.machine_id = machine_id
         self.api_key = api_key
         self.logger = logger
+        self.compression = compression
         self.websocket = None
         self.connected = False
         self.reconnect_interval = 5
@@ -52,7 +57,8 @@ class WebSocketClient:
                 ssl=self.ssl_context,
                 ping_interval=20,
                 ping_timeout=10,
-                close_timeout=5
+                close_timeout=5,
+                compression='deflate' if self.compression else None
             )
             
             self.connected = True
@@ -95,7 +101,7 @@ class WebSocketClient:
                 'data': metrics
             }
             
-            await self.websocket.send(json.dumps(message))
+            await self.websocket.send(json_dumps(message))
             self.logger.debug("Metrics sent successfully")
             return True
             
@@ -118,7 +124,7 @@ class WebSocketClient:
                 'data': alert
             }
             
-            await self.websocket.send(json.dumps(message))
+            await self.websocket.send(json_dumps(message))
             self.logger.info(f"Alert sent: {alert.get('level', 'unknown')} - {alert.get('message', 'no message')}")
             return True
             
@@ -140,7 +146,7 @@ class WebSocketClient:
                 'data': status
             }
             
-            await self.websocket.send(json.dumps(message))
+            await self.websocket.send(json_dumps(message))
             return True
             
         except Exception as e:
@@ -167,14 +173,14 @@ class WebSocketClient:
                 'data': {
                     'agent_version': '1.0.0',
                     'platform': {
-                        'system': __import__('platform').system(),
-                        'release': __import__('platform').release(),
-                        'machine': __import__('platform').machine()
+                        'system': platform.system(),
+                        'release': platform.release(),
+                        'machine': platform.machine()
                     }
                 }
             }
             
-            await self.websocket.send(json.dumps(registration))
+            await self.websocket.send(json_dumps(registration))
             self.logger.debug("Registration message sent")
             
         except Exception as e:
@@ -192,7 +198,7 @@ class WebSocketClient:
                         'machine_id': self.machine_id
                     }
                     
-                    await self.websocket.send(json.dumps(heartbeat))
+                    await self.websocket.send(json_dumps(heartbeat))
                     self.last_heartbeat = current_time
                     self.logger.debug("Heartbeat sent")
                 
@@ -255,7 +261,7 @@ class WebSocketClient:
         }
         
         try:
-            await self.websocket.send(json.dumps(response))
+            await self.websocket.send(json_dumps(response))
         except Exception as e:
             self.logger.error(f"Failed to send command response: {e}")
     
@@ -281,7 +287,7 @@ class WebSocketClient:
         }
         
         try:
-            await self.websocket.send(json.dumps(pong))
+            await self.websocket.send(json_dumps(pong))
         except Exception as e:
             self.logger.error(f"Failed to send pong: {e}")
     
@@ -296,7 +302,9 @@ class WebSocketClient:
                     self.logger.info("Reconnection successful")
                     break
                 else:
-                    await asyncio.sleep(self.reconnect_interval)
+                    # Exponential backoff with jitter to avoid reconnect storms
+                    delay = min(self.reconnect_interval * 2 ** (self.reconnect_attempts - 1), 300)
+                    await asyncio.sleep(delay + random.uniform(0, self.reconnect_interval))
             else:
                 await asyncio.sleep(1)
         
@@ -6,7 +6,6 @@ import os
 import sys
 import platform
 import subprocess
-import psutil
 from pathlib import Path
 import json
 import time
@@ -125,6 +124,8 @@ class ServiceManager:
             status["running"] = self.is_service_running()
             
             if status["running"]:
+                import psutil
+                
                 # Try to find the process
                 for proc in psutil.process_iter(['pid', 'name', 'cmdline', 'create_time', 'memory_info', 'cpu_percent']):
                     try:
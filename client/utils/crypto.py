@@ -23,6 +23,12 @@ try:
 except ImportError:
     CRYPTOGRAPHY_AVAILABLE = False
 
+# Platform identity does not change while the agent runs; platform.processor()
+# may shell out to `uname -p`, so resolve these once at import time
+_SYS = platform.system()
+_MACH = platform.machine()
+_PROC = platform.processor()
+
 class CryptoUtils:
     """Cryptographic utilities for the agent"""
     
@@ -34,10 +40,10 @@ class CryptoUtils:
         """
         # Collect machine-specific information
         machine_info = [
-            platform.node(),  # Hostname
-            platform.machine(),  # Architecture
-            platform.processor(),  # Processor
-            str(uuid.getnode()),  # MAC address
+            platform.node().encode(),  # Hostname
+            _MACH.encode(),  # Architecture
+            _PROC.encode(),  # Processor
+            str(uuid.getnode()).encode(),  # MAC address
         ]
         
         # Try to get additional unique identifiers
@@ -47,14 +53,13 @@ class CryptoUtils:
             for interface, addrs in psutil.net_if_addrs().items():
                 for addr in addrs:
                     if addr.family == psutil.AF_LINK and addr.address != '00:00:00:00:00:00':
-                        machine_info.append(addr.address)
+                        machine_info.append(addr.address.encode())
                         break
         except:
             pass
         
-        # Create hash of machine information
-        machine_string = '|'.join(filter(None, machine_info))
-        machine_hash = hashlib.sha256(machine_string.encode()).hexdigest()
+        # Create hash of machine information (kept as SHA-256 so existing IDs stay stable)
+        machine_hash = hashlib.sha256(b'|'.join(filter(None, machine_info))).hexdigest()
         
         # Format as UUID-like string
         return f"agent-{machine_hash[:8]}-{machine_hash[8:12]}-{machine_hash[12:16]}-{machine_hash[16:20]}-{machine_hash[20:32]}"
@@ -147,9 +152,6 @@ class SecureStorage:
     def load_data(self) -> Optional[Dict[str, Any]]:
         """Load data securely"""
         try:
-            if not self.storage_path.exists():
-                return None
-            
             if self._key and CRYPTOGRAPHY_AVAILABLE:
                 # Decrypt data
                 encrypted_data = self.storage_path.read_bytes()
@@ -160,6 +162,8 @@ class SecureStorage:
                 json_data = self.storage_path.read_text()
             
             return json.loads(json_data)
+        except FileNotFoundError:
+            return None
         except Exception as e:
             print(f"Error loading data: {e}")
             return None
@@ -245,10 +249,10 @@ def create_machine_fingerprint() -> Dict[str, Any]:
     fingerprint = {
         'machine_id': generate_machine_id(),
         'hostname': platform.node(),
-        'system': platform.system(),
+        'system': _SYS,
         'release': platform.release(),
-        'architecture': platform.machine(),
-        'processor': platform.processor(),
+        'architecture': _MACH,
+        'processor': _PROC,
         'python_version': platform.python_version(),
         'timestamp': int(time.time())
     }
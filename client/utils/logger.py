@@ -5,6 +5,7 @@ and structured logging for better debugging and monitoring
 """
 import logging
 import logging.handlers
+import platform
 import sys
 from pathlib import Path
 from typing import Optional, Dict, Any
@@ -18,6 +19,12 @@ try:
 except ImportError:
     COLORLOG_AVAILABLE = False
 
+try:
+    from concurrent_log_handler import ConcurrentRotatingFileHandler
+    CONCURRENT_LOG_HANDLER_AVAILABLE = True
+except ImportError:
+    CONCURRENT_LOG_HANDLER_AVAILABLE = False
+
 class JSONFormatter(logging.Formatter):
     """JSON formatter for structured logging"""
     
@@ -64,13 +71,23 @@ class AgentLogger:
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Create rotating file handler
-        file_handler = logging.handlers.RotatingFileHandler(
-            log_file,
-            maxBytes=max_size * 1024 * 1024,  # Convert MB to bytes
-            backupCount=backup_count,
-            encoding='utf-8'
-        )
+        # Create rotating file handler, preferring the lock-based handler that
+        # rolls over with atomic renames and gzips archived logs
+        if CONCURRENT_LOG_HANDLER_AVAILABLE:
+            file_handler = ConcurrentRotatingFileHandler(
+                log_file,
+                maxBytes=max_size * 1024 * 1024,  # Convert MB to bytes
+                backupCount=backup_count,
+                encoding='utf-8',
+                use_gzip=True
+            )
+        else:
+            file_handler = logging.handlers.RotatingFileHandler(
+                log_file,
+                maxBytes=max_size * 1024 * 1024,  # Convert MB to bytes
+                backupCount=backup_count,
+                encoding='utf-8'
+            )
         
         # Set level
         numeric_level = getattr(logging, level.upper(), logging.INFO)
@@ -280,7 +297,6 @@ def setup_logger(name: str = "master_dashboard_agent",
     
     # Setup syslog on Unix systems
     try:
-        import platform
         if platform.system().lower() != 'windows':
             agent_logger.setup_syslog_logging(level=level)
     except:
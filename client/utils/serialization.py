@@ -0,0 +1,21 @@
+"""
+Serialization utilities for Master Dashboard Agent
+Provides the JSON encoder shared by the HTTP and WebSocket clients
+"""
+import json
+from typing import Any
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def json_dumps(data: Any) -> str:
+    """Serialize to a JSON string, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass  # e.g. tuple subclasses, which only the stdlib encoder accepts
+    return json.dumps(data)
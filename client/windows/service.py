@@ -23,10 +23,12 @@ except ImportError:
 AGENT_DIR = Path(__file__).parent.parent
 sys.path.insert(0, str(AGENT_DIR))
 
-from agent import MasterDashboardAgent
 from utils.logger import setup_logger
 
-class MasterDashboardService(win32serviceutil.ServiceFramework):
+# Without pywin32 the module must still import so main() can report it
+_ServiceFramework = win32serviceutil.ServiceFramework if WIN32_AVAILABLE else object
+
+class MasterDashboardService(_ServiceFramework):
     """Windows service wrapper for Master Dashboard Agent"""
     
     _svc_name_ = "MasterDashboardAgent"
@@ -44,12 +46,11 @@ class MasterDashboardService(win32serviceutil.ServiceFramework):
     def SvcStop(self):
         """Stop the service"""
         self.ReportServiceStatus(win32service.SERVICE_STOP_PENDING)
-        win32event.SetEvent(self.stop_event)
         
         if self.logger:
             self.logger.info("Service stop requested")
         
-        # Stop the agent
+        # Stop the agent (flushing buffered metrics) before releasing SvcDoRun
         if self.agent and self.loop:
             try:
                 future = asyncio.run_coroutine_threadsafe(self.agent.stop(), self.loop)
@@ -58,6 +59,8 @@ class MasterDashboardService(win32serviceutil.ServiceFramework):
                 if self.logger:
                     self.logger.error(f"Error stopping agent: {e}")
         
+        win32event.SetEvent(self.stop_event)
+        
         if self.logger:
             self.logger.info("Service stopped")
     
@@ -123,6 +126,9 @@ class MasterDashboardService(win32serviceutil.ServiceFramework):
     def run_agent(self):
         """Run the agent in async context"""
         try:
+            # Imported here so service management commands don't load the collectors
+            from agent import MasterDashboardAgent
+            
             # Create new event loop for this thread
             self.loop = asyncio.new_event_loop()
             asyncio.set_event_loop(self.loop)